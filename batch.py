@@ -0,0 +1,179 @@
+"""병원결과/병원소견 파일 쌍 여러 개를 프로세스 풀로 한꺼번에 변환
+
+사용 예:
+    python batch.py 입력폴더                       # *병원결과*.xlsx 와 *병원소견*.xlsx 를 이름으로 짝지음
+    python batch.py 목록.csv --template LG결과.xlsx  # 병원결과,병원소견,output 열을 가진 CSV
+    python batch.py 입력폴더 --verify              # 변환 후 결과 파일을 원본과 다시 비교 (verify.py)
+"""
+import argparse
+import contextlib
+import csv
+import io
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from lg_converter import ConversionError, ConvertConfig, convert, load_mapping, verify_output
+
+HOSPITAL_KEYWORD = "병원결과"
+OPINION_KEYWORD = "병원소견"
+OUTPUT_KEYWORD = "LG결과_변환"
+
+
+def find_pairs(input_dir, output_dir):
+    """폴더에서 이름의 '병원결과'를 '병원소견'으로 바꾼 파일이 있는 쌍을 찾아 (병원결과, 병원소견, output) 목록을 반환"""
+    names = set(os.listdir(input_dir))
+    jobs = []
+    for name in sorted(names):
+        if not name.endswith(".xlsx") or name.startswith("~$") or HOSPITAL_KEYWORD not in name:
+            continue
+        opinion_name = name.replace(HOSPITAL_KEYWORD, OPINION_KEYWORD)
+        if opinion_name not in names:
+            print(f"경고: {name}에 짝이 되는 {opinion_name} 파일이 없어 건너뜁니다.")
+            continue
+        jobs.append((
+            os.path.join(input_dir, name),
+            os.path.join(input_dir, opinion_name),
+            os.path.join(output_dir, name.replace(HOSPITAL_KEYWORD, OUTPUT_KEYWORD)),
+        ))
+    return jobs
+
+
+def read_manifest(manifest_file):
+    """병원결과,병원소견,output 세 열의 CSV 목록을 읽음 (상대 경로는 목록 파일 기준)"""
+    base_dir = os.path.dirname(os.path.abspath(manifest_file))
+    jobs = []
+    with open(manifest_file, newline="", encoding="utf-8-sig") as f:
+        for row in csv.reader(f):
+            if len(row) < 3 or not row[0].strip() or row[0].strip() in (HOSPITAL_KEYWORD, "hospital"):
+                continue
+            jobs.append(tuple(os.path.join(base_dir, value.strip()) for value in row[:3]))
+    return jobs
+
+
+def run_job(job, lg_file, config, verify=False):
+    """작업 프로세스에서 파일 쌍 하나를 변환하고 결과 요약을 반환 (예외는 요약에 담아 반환)
+
+    verify가 참이면 변환 후 결과 파일을 원본과 다시 비교하여 불일치 수(값 불일치 칸 + 누락/추가 행)를 담는다.
+    """
+    hospital_file, opinion_file, output_file = job
+    log = io.StringIO()
+    start = time.perf_counter()
+    summary = {}
+    error = None
+    try:
+        with contextlib.redirect_stdout(log):
+            report = convert(hospital_file, opinion_file, lg_file, output_file, config)
+            for line in report.summary_lines():
+                print(line)
+        summary = {
+            "rows": report.rows,
+            "matched": report.matched,
+            "unmatched_rows": report.unmatched_rows,
+            "unmatched_opinion": report.unmatched_opinion,
+        }
+        if verify:
+            with contextlib.redirect_stdout(log):
+                checked = verify_output(hospital_file, opinion_file, output_file, config)
+                for line in checked.summary_lines():
+                    print(line)
+            summary["mismatches"] = checked.mismatch_count + len(checked.missing_rows) + len(checked.extra_rows)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        log.write(traceback.format_exc())
+
+    # 파일별 상세 로그는 결과 파일 옆에 남김
+    try:
+        with open(f"{output_file}.log", "w", encoding="utf-8") as f:
+            f.write(log.getvalue())
+    except OSError:
+        pass
+
+    return {
+        "hospital": hospital_file,
+        "output": output_file,
+        "elapsed": time.perf_counter() - start,
+        "error": error,
+        **summary,
+    }
+
+
+def run_batch(jobs, lg_file, workers=None, config=None, verify=False):
+    """모든 작업을 프로세스 풀에서 실행. 한 파일이 실패해도 나머지는 계속 진행"""
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_job, job, lg_file, config or ConvertConfig(), verify): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # 작업 프로세스가 비정상 종료된 경우 등
+                hospital_file, _, output_file = futures[future]
+                result = {"hospital": hospital_file, "output": output_file, "elapsed": 0.0,
+                          "error": f"{type(e).__name__}: {e}"}
+            status = "실패" if result["error"] else "완료"
+            print(f"[{status}] {os.path.basename(result['hospital'])} ({result['elapsed']:.2f}초)")
+            results.append(result)
+    return results
+
+
+def print_summary(results, elapsed):
+    print("\n=== 일괄 변환 요약 ===")
+    print(f"{'파일':<40} {'행':>7} {'매칭':>7} {'결과미매칭':>10} {'소견미매칭':>10} {'시간(초)':>9}  상태")
+    totals = {"rows": 0, "matched": 0, "unmatched_rows": 0, "unmatched_opinion": 0}
+    for result in sorted(results, key=lambda r: r["hospital"]):
+        name = os.path.basename(result["hospital"])
+        if result["error"]:
+            print(f"{name:<40} {'-':>7} {'-':>7} {'-':>10} {'-':>10} {result['elapsed']:>9.2f}  실패: {result['error']}")
+            continue
+        for key in totals:
+            totals[key] += result.get(key, 0)
+        status = f"검증 불일치 {result['mismatches']}건" if result.get("mismatches") else "완료"
+        print(f"{name:<40} {result['rows']:>7} {result['matched']:>7} {result['unmatched_rows']:>10} "
+              f"{result['unmatched_opinion']:>10} {result['elapsed']:>9.2f}  {status}")
+
+    failed = sum(1 for result in results if result["error"])
+    print(f"{'합계':<40} {totals['rows']:>7} {totals['matched']:>7} {totals['unmatched_rows']:>10} "
+          f"{totals['unmatched_opinion']:>10} {elapsed:>9.2f}")
+    print(f"파일 {len(results)}개 중 성공 {len(results) - failed}개, 실패 {failed}개")
+    mismatched = sum(1 for result in results if result.get("mismatches"))
+    if mismatched:
+        print(f"검증 불일치 파일 {mismatched}개 (결과 파일 옆 .검증.csv 참고)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="병원결과/병원소견 파일 쌍 일괄 변환")
+    parser.add_argument("source", help="입력 폴더 또는 병원결과,병원소견,output CSV 목록 파일")
+    parser.add_argument("--template", default="LG결과.xlsx", help="LG결과 템플릿 파일")
+    parser.add_argument("--output-dir", help="폴더 입력 시 결과를 저장할 폴더 (기본: 입력 폴더)")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--stream", action="store_true", help="스트리밍 모드로 변환")
+    parser.add_argument("--mapping", help="열 매핑 설정 파일 (json/yaml/csv, 생략 시 기본 매핑)")
+    parser.add_argument("--verify", action="store_true", help="변환 후 결과 파일을 원본과 다시 비교")
+    args = parser.parse_args()
+
+    try:
+        batch_config = ConvertConfig(stream=args.stream, **(load_mapping(args.mapping) if args.mapping else {}))
+    except ConversionError as e:
+        print(f"에러: {e}")
+        raise SystemExit(1)
+
+    if os.path.isdir(args.source):
+        output_dir = args.output_dir or args.source
+        os.makedirs(output_dir, exist_ok=True)
+        batch_jobs = find_pairs(args.source, output_dir)
+    else:
+        batch_jobs = read_manifest(args.source)
+
+    if not batch_jobs:
+        print("변환할 파일 쌍이 없습니다.")
+    else:
+        print(f"{len(batch_jobs)}개 파일 쌍 변환 시작 (작업 프로세스: {args.workers or os.cpu_count()}개)")
+        batch_start = time.perf_counter()
+        batch_results = run_batch(batch_jobs, os.path.abspath(args.template), args.workers, batch_config,
+                                  args.verify)
+        print_summary(batch_results, time.perf_counter() - batch_start)
+        # 실패하거나 검증이 불일치한 파일이 하나라도 있으면 종료 코드 1 (예약 작업/스크립트에서 실패를 알 수 있도록)
+        if any(result["error"] or result.get("mismatches") for result in batch_results):
+            raise SystemExit(1)
@@ -0,0 +1,154 @@
+"""합성 워크북으로 convert()를 처음부터 끝까지 실행하여 시간과 메모리를 기록
+
+    python -m benchmarks.bench_convert                          # 1k, 10k, 100k행
+    python -m benchmarks.bench_convert --sizes 1000 10000 --modes memory stream
+    python -m benchmarks.bench_convert --output 결과.json --compare 이전결과.json
+
+실행마다 새 프로세스에서 변환하여 최대 RSS가 다른 실행의 영향을 받지 않게 하고,
+단계별 시간은 load(템플릿+병원결과), transform(헤더 해석+행 변환), join(소견 로드+매칭), save(셀 쓰기+저장)로 묶어 기록한다.
+--compare를 주면 이전 JSON과 크기/모드별로 비교하여 --threshold보다 느려진 항목이 있으면 종료 코드 1.
+"""
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import openpyxl
+
+from lg_converter import ConvertConfig, convert
+
+from .workbooks import generate
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+MODES = ("memory", "stream", "csv", "parquet")
+OUTPUT_EXTENSIONS = {"memory": "xlsx", "stream": "xlsx", "csv": "csv", "parquet": "parquet"}
+STAGE_GROUPS = {
+    "load": ("template", "hospital"),
+    "transform": ("headers", "transform", "stream"),
+    "join": ("opinion", "join"),
+    "save": ("write", "save"),
+}
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS(MB). 측정할 수 없으면 None"""
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    info = psutil.Process().memory_info()
+    return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+
+
+def run_once(files, output_file, mode):
+    """작업 프로세스에서 변환 한 번을 실행하고 측정값을 반환"""
+    hospital_file, opinion_file, template_file = files
+    config = ConvertConfig(stream=mode == "stream", join_report=False)  # csv/parquet은 확장자로 결정
+    start = time.perf_counter()
+    report = convert(hospital_file, opinion_file, template_file, output_file, config, log=lambda message: None)
+    wall = time.perf_counter() - start
+    peak = peak_rss_mb()
+    stages = {group: round(sum(report.timings.get(name, 0.0) for name in names), 4)
+              for group, names in STAGE_GROUPS.items()}
+    return {
+        "wall": round(wall, 4),
+        "peak_rss_mb": round(peak, 1) if peak is not None else None,
+        "stages": stages,
+        "timings": {name: round(seconds, 4) for name, seconds in report.timings.items()},
+        "rows": report.rows,
+        "matched": report.matched,
+    }
+
+
+def run_benchmark(sizes, modes, work_dir, repeat=1):
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for size in sizes:
+        gen_start = time.perf_counter()
+        files = generate(work_dir, size)
+        print(f"{size}행 입력 준비 {time.perf_counter() - gen_start:.1f}초")
+        for mode in modes:
+            output_file = os.path.join(work_dir, f"LG결과_변환_{size}_{mode}.{OUTPUT_EXTENSIONS[mode]}")
+            runs = []
+            for _ in range(repeat):
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    runs.append(executor.submit(run_once, files, output_file, mode).result())
+            best = min(runs, key=lambda run: run["wall"])
+            result = {"size": size, "mode": mode, **best}
+            print(f"  {mode:<6} {best['wall']:>8.2f}초  최대 RSS {best['peak_rss_mb']}MB  "
+                  + ", ".join(f"{group} {seconds:.2f}" for group, seconds in best["stages"].items()))
+            results.append(result)
+    return results
+
+
+def compare(previous, current, threshold):
+    """이전 실행과 크기/모드별로 비교하여 출력하고 느려진 항목 수를 반환"""
+    before = {(result["size"], result["mode"]): result for result in previous["results"]}
+    regressions = 0
+    print(f"\n=== 이전 실행과 비교 (기준 {threshold:.0%}) ===")
+    for result in current["results"]:
+        old = before.get((result["size"], result["mode"]))
+        if old is None:
+            continue
+        ratio = result["wall"] / old["wall"] if old["wall"] else 1.0
+        status = ""
+        if ratio > 1 + threshold:
+            status = "  ← 느려짐"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            status = "  빨라짐"
+        print(f"{result['size']:>7}행 {result['mode']:<6} {old['wall']:>8.2f}초 → {result['wall']:>8.2f}초 "
+              f"({ratio - 1:+.1%}){status}")
+        for group, seconds in result["stages"].items():
+            old_seconds = old.get("stages", {}).get(group)
+            if old_seconds:
+                print(f"{'':>16}{group:<10} {old_seconds:>8.2f}초 → {seconds:>8.2f}초")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="변환 전체 과정 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES[:2]),
+                        help="memory/stream: xlsx 결과, csv/parquet: 평면 파일 결과 (기본: memory stream)")
+    parser.add_argument("--repeat", type=int, default=1, help="크기/모드별 반복 횟수 (가장 빠른 실행 기록)")
+    parser.add_argument("--work-dir", default=os.path.join(tempfile.gettempdir(), "lg_converter_bench"),
+                        help="합성 입력과 결과 파일을 둘 폴더 (입력은 다음 실행에서 재사용)")
+    parser.add_argument("--output", default="bench_result.json", help="결과 JSON 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.1, help="느려짐으로 판단할 비율 (기본 0.1 = 10%%)")
+    args = parser.parse_args()
+
+    current = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "openpyxl": openpyxl.__version__,
+        "results": run_benchmark(args.sizes, args.modes, args.work_dir, args.repeat),
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(current, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        if compare(previous, current, args.threshold):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""열별 변환 결과 캐시(memo.py)를 켠 스칼라 변환과 끈 스칼라 변환 비교
+
+    python -m benchmarks.bench_memo                  # 20k행, 값 종류 40개 / 합성 기본 분포
+    python -m benchmarks.bench_memo --rows 50000 --distinct 10 100 1000
+
+값 종류가 적은 실제 파일과 비슷하도록, EMP_NO/SSN을 뺀 열은 처음 N행의 값 중에서 다시 뽑은 데이터(값 종류 N개)를 만들고,
+합성 기본 분포(숫자 문자열 대부분이 서로 다른 값)도 함께 측정한다. 결과가 값과 타입까지 같은지 확인한 뒤
+변환 시간, 속도 향상 배율, 캐시 적중률을 출력한다.
+
+열 종류별 시간도 따로 잰다. 캐시가 도움이 되는 곳은 변환 함수가 있는 열(convert_to_numeric 등)뿐이고,
+변환 없이 값을 복사하는 열(UA2xx, US*, GY*, GI* 등)은 같은 크기의 캐시를 씌우면 조회 비용만큼 느려진다.
+"""
+import argparse
+import random
+import time
+from functools import lru_cache
+
+from lg_converter.memo import DEFAULT_SIZE, UNIQUE_COLUMNS, ConverterMemo, chain
+from lg_converter.plan import iter_transformed_rows
+
+from .bench_parallel import build_plan
+from .compare import first_difference
+from .synthetic import hospital_rows
+
+
+def low_cardinality(rows, keep_columns, distinct, seed=0):
+    """keep_columns를 뺀 열의 값을 처음 distinct행의 값 중에서 다시 뽑은 행 목록"""
+    rnd = random.Random(seed)
+    pools = [[row[col_idx] for row in rows[:distinct]] for col_idx in range(len(rows[0]))]
+    return [tuple(value if col_idx in keep_columns else rnd.choice(pools[col_idx])
+                  for col_idx, value in enumerate(row)) for row in rows]
+
+
+def best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def column_costs(data, plan, lg_headers, memo_size, repeat):
+    """{열 종류: (열 수, 캐시 없음 시간, 캐시 사용 시간)}. 변환 없는 열의 캐시 사용 시간은 값을 그대로 돌려주는 캐시"""
+    names = {col_idx: name for name, col_idx in lg_headers.items()}
+    groups = {"변환 함수가 있는 열": [], "변환 없이 복사하는 열": []}
+    for src_idx, lg_col, converters, _ in plan:
+        if names[lg_col] not in UNIQUE_COLUMNS:
+            column = [row[src_idx] for row in data]
+            if converters:
+                groups["변환 함수가 있는 열"].append((column, chain(converters)))
+            else:
+                groups["변환 없이 복사하는 열"].append((column, None))
+
+    def plain(columns):
+        return [[convert(value) for value in column] if convert is not None else [value for value in column]
+                for column, convert in columns]
+
+    def cached(columns):
+        result = []
+        for column, convert in columns:
+            lookup = lru_cache(memo_size, typed=True)(convert or (lambda value: value))
+            result.append([lookup(value) if type(value) is str else (convert(value) if convert else value)
+                           for value in column])
+        return result
+
+    costs = {}
+    for label, columns in groups.items():
+        _, plain_elapsed = best_of(repeat, lambda: plain(columns))
+        _, cached_elapsed = best_of(repeat, lambda: cached(columns))
+        costs[label] = (len(columns), plain_elapsed, cached_elapsed)
+    return costs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="변환 캐시 효과 측정")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--distinct", type=int, nargs="+", default=[40], help="열별 값 종류 수")
+    parser.add_argument("--memo-size", type=int, default=DEFAULT_SIZE)
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 후 가장 빠른 시간 사용")
+    args = parser.parse_args()
+
+    headers, rows = hospital_rows(args.rows)
+    plan, lg_headers = build_plan(headers)
+    names = {col_idx: name for name, col_idx in lg_headers.items()}
+    keep_columns = {src_idx for src_idx, lg_col, _, _ in plan if names[lg_col] in UNIQUE_COLUMNS}
+    datasets = [(f"값 종류 {distinct}개", low_cardinality(rows, keep_columns, distinct)) for distinct in args.distinct]
+    datasets.append(("합성 기본 분포", rows))
+
+    print(f"{args.rows}행 x {len(plan)}열, 캐시 크기 {args.memo_size}")
+    failed = 0
+    for label, data in datasets:
+        expected, plain_elapsed = best_of(args.repeat, lambda: list(iter_transformed_rows(data, plan, lg_headers)))
+        memo = None
+
+        def run_memo():
+            nonlocal memo
+            memo = ConverterMemo(args.memo_size)
+            return list(iter_transformed_rows(data, plan, lg_headers, memo))
+
+        actual, memo_elapsed = best_of(args.repeat, run_memo)
+        difference = first_difference(expected, actual)
+        failed += difference is not None
+        print(f"  {label}")
+        print(f"    캐시 없음 : {plain_elapsed:.3f}초")
+        print(f"    캐시 사용 : {memo_elapsed:.3f}초 ({plain_elapsed / memo_elapsed:.2f}배)")
+        print(f"    {memo.summary_line()}")
+        print(f"    결과 일치 : {'예' if difference is None else '아니오 - ' + difference}")
+        for group, (count, plain_column, cached_column) in column_costs(
+                data, plan, lg_headers, args.memo_size, args.repeat).items():
+            print(f"    {group} {count}개: 캐시 없음 {plain_column:.3f}초, "
+                  f"캐시 사용 {cached_column:.3f}초 ({plain_column / cached_column:.2f}배)")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""직렬 행 변환과 프로세스 풀 병렬 변환(parallel.py)의 손익분기 비교
+
+    python -m benchmarks.bench_parallel                          # 1k/10k/50k행, 작업 프로세스 2/4개
+    python -m benchmarks.bench_parallel --rows 100000 --workers 2 4 8 --chunk-sizes 2000 10000
+
+행 수 x 작업 프로세스 수 x 묶음 크기마다 결과가 직렬 변환과 값과 타입까지 같은지 확인하고
+변환 시간과 배율을 출력한다. 병렬 변환은 프로세스 시작과 행 직렬화(pickle) 비용이 있으므로
+행 수가 적으면 직렬보다 느리며, 마지막에 행 수별로 가장 빠른 설정과 처음 이득이 나는 행 수를 알려 준다.
+"""
+import argparse
+import os
+import time
+
+from lg_converter import parallel
+from lg_converter.mappings import COLUMN_MAP, NUMERIC_COLUMNS, OPINION_COLUMNS, RIGHT_ALIGN_COLUMNS
+from lg_converter.plan import build_transform_plan, iter_transformed_rows
+
+from .compare import first_difference
+from .synthetic import hospital_rows
+
+
+def build_plan(headers):
+    hospital_headers = {header: col_idx for col_idx, header in enumerate(headers, 1)}
+    lg_columns = ["SEQ"] + list(dict.fromkeys(COLUMN_MAP.values())) + ["BM06"] + list(OPINION_COLUMNS.values())
+    lg_headers = {header: col_idx for col_idx, header in enumerate(lg_columns, 1)}
+    plan = build_transform_plan(hospital_headers, lg_headers, COLUMN_MAP, NUMERIC_COLUMNS, RIGHT_ALIGN_COLUMNS)
+    return plan, lg_headers
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="직렬/병렬 행 변환 비교")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[2000, 10000])
+    args = parser.parse_args()
+
+    print(f"CPU {os.cpu_count()}개 (CPU가 하나뿐이면 병렬 변환은 이득이 없음)")
+    print(f"{'행':>7} {'프로세스':>8} {'묶음':>7} {'시간':>9} {'배율':>6}  일치")
+    failed = 0
+    break_even = None
+    for count in args.rows:
+        headers, rows = hospital_rows(count)
+        plan, lg_headers = build_plan(headers)
+        expected, serial_elapsed = timed(lambda: list(iter_transformed_rows(rows, plan, lg_headers)))
+        print(f"{count:>7} {'직렬':>8} {'-':>7} {serial_elapsed:>8.3f}초 {1.0:>5.2f}배")
+        best = None
+        for workers in args.workers:
+            for chunk_size in args.chunk_sizes:
+                actual, elapsed = timed(lambda: list(parallel.iter_transformed_rows(rows, plan, lg_headers,
+                                                                                   workers, chunk_size)))
+                difference = first_difference(expected, actual)
+                failed += difference is not None
+                speedup = serial_elapsed / elapsed
+                status = "예" if difference is None else f"아니오 - {difference}"
+                if count < chunk_size:
+                    # 묶음 하나뿐이면 프로세스를 띄우지 않으므로 손익분기 판단에서 제외
+                    status += " (묶음 하나 - 현재 프로세스에서 변환)"
+                elif best is None or speedup > best[0]:
+                    best = (speedup, workers, chunk_size)
+                print(f"{count:>7} {workers:>8} {chunk_size:>7} {elapsed:>8.3f}초 {speedup:>5.2f}배  {status}")
+        if best is not None:
+            print(f"  → {count}행 최적: 프로세스 {best[1]}개, 묶음 {best[2]}행 ({best[0]:.2f}배)")
+            if break_even is None and best[0] > 1.0:
+                break_even = count
+    if break_even is None:
+        print("측정한 행 수에서는 병렬 변환이 직렬보다 빠르지 않았습니다.")
+    else:
+        print(f"병렬 변환 이득 시작: {break_even}행부터")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
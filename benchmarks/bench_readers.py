@@ -0,0 +1,89 @@
+"""openpyxl과 calamine 읽기 백엔드의 값 일치 검사와 읽기 시간 비교
+
+    python -m benchmarks.bench_readers                       # 합성 1k, 10k행 병원결과/병원소견
+    python -m benchmarks.bench_readers --sizes 100000
+    python -m benchmarks.bench_readers 병원결과.xlsx 병원소견.xlsx  # 실제 파일
+
+두 백엔드가 시트의 모든 행에서 같은 값을 내보내는지 확인하고(행 끝의 빈 칸은 무시),
+다른 값이 있으면 첫 차이를 출력하고 종료 코드 1로 끝난다.
+공백만 있는 문자열과 빈 칸의 차이(readers 모듈 설명 참고)는 따로 세어 알려 준다.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from lg_converter import readers
+
+from .workbooks import generate
+
+
+def read_all(path, backend):
+    start = time.perf_counter()
+    sheet = readers.open_sheet(path, backend)
+    try:
+        rows = list(sheet.iter_rows())
+    finally:
+        sheet.close()
+    return rows, time.perf_counter() - start
+
+
+def trim(row):
+    row = list(row)
+    while row and row[-1] is None:
+        row.pop()
+    return row
+
+
+def compare_rows(expected, actual):
+    """(공백 문자열 차이 수, 첫 번째 실제 차이 설명 또는 None)"""
+    blank_differences = 0
+    # 행 개수가 다르면 짧은 쪽을 빈 행으로 보고 비교
+    for row_no in range(max(len(expected), len(actual))):
+        left = trim(expected[row_no]) if row_no < len(expected) else []
+        right = trim(actual[row_no]) if row_no < len(actual) else []
+        for col_no in range(max(len(left), len(right))):
+            a = left[col_no] if col_no < len(left) else None
+            b = right[col_no] if col_no < len(right) else None
+            if type(a) is type(b) and a == b:
+                continue
+            if b is None and isinstance(a, str) and not a.strip():
+                blank_differences += 1
+                continue
+            return blank_differences, f"{row_no + 1}행 {col_no + 1}열: openpyxl {a!r} / calamine {b!r}"
+    return blank_differences, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="읽기 백엔드 일치 검사와 속도 비교")
+    parser.add_argument("files", nargs="*", help="검사할 xlsx 파일 (생략 시 합성 파일)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--work-dir", default=os.path.join(tempfile.gettempdir(), "lg_converter_bench"))
+    args = parser.parse_args()
+    if not readers.calamine_available():
+        raise SystemExit("python-calamine이 설치되어 있지 않습니다 (pip install python-calamine).")
+
+    files = args.files
+    if not files:
+        for size in args.sizes:
+            hospital_file, opinion_file, _ = generate(args.work_dir, size)
+            files += [hospital_file, opinion_file]
+
+    failed = 0
+    print(f"{'파일':<28} {'행':>7} {'openpyxl':>9} {'calamine':>9} {'배율':>6}  일치")
+    for path in files:
+        expected, openpyxl_elapsed = read_all(path, "openpyxl")
+        actual, calamine_elapsed = read_all(path, "calamine")
+        blank_differences, difference = compare_rows(expected, actual)
+        status = "예" if difference is None else f"아니오 - {difference}"
+        if blank_differences:
+            status += f" (공백 문자열 → 빈 칸 {blank_differences}개)"
+        failed += difference is not None
+        print(f"{os.path.basename(path):<28} {len(expected):>7} {openpyxl_elapsed:>8.2f}초 {calamine_elapsed:>8.2f}초 "
+              f"{openpyxl_elapsed / calamine_elapsed:>5.1f}배  {status}")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
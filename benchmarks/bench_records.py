@@ -0,0 +1,80 @@
+"""변환된 행을 값 리스트로 보관할 때와 열 저장소(records.RecordStore)에 보관할 때의 메모리 비교
+
+    python -m benchmarks.bench_records [--rows 20000]
+
+두 방식으로 꺼낸 행이 값과 타입까지 같은지, 숫자 열의 실수 NaN과 빈 값이 구분되어 나오는지 확인한 뒤 tracemalloc으로 잰 보관 메모리와 채우기/꺼내기 시간을 출력한다.
+(원본 행 자체의 메모리는 두 방식에 공통이므로 포함하지 않음)
+"""
+import argparse
+import math
+import time
+import tracemalloc
+
+from lg_converter.helpers import convert_to_numeric
+from lg_converter.plan import iter_transformed_rows
+from lg_converter.records import RecordStore
+
+from .bench_parallel import build_plan
+from .compare import first_difference
+from .synthetic import hospital_rows
+
+
+def measure(fill):
+    """(보관 객체, 보관 메모리 MB, 채우기 시간)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = fill()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return records, current / 2 ** 20, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="변환 행 보관 메모리 측정")
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    headers, rows = hospital_rows(args.rows)
+    plan, lg_headers = build_plan(headers)
+
+    def fill_store():
+        store = RecordStore(plan, lg_headers)
+        store.extend(iter_transformed_rows(rows, plan, lg_headers))
+        return store
+
+    print(f"{args.rows}행 x {len(plan)}열")
+    expected, list_mb, list_elapsed = measure(lambda: list(iter_transformed_rows(rows, plan, lg_headers)))
+    print(f"  값 리스트   : {list_mb:.1f}MB (채우기 {list_elapsed:.3f}초)")
+    del expected
+    store, store_mb, store_elapsed = measure(fill_store)
+    start = time.perf_counter()
+    actual = list(store)
+    drain_elapsed = time.perf_counter() - start
+    print(f"  열 저장소   : {store_mb:.1f}MB (채우기 {store_elapsed:.3f}초, 꺼내기 {drain_elapsed:.3f}초)")
+    print(f"  메모리 비율 : {store_mb / list_mb:.2f}")
+
+    difference = first_difference(list(iter_transformed_rows(rows, plan, lg_headers)), actual)
+    if difference is None:
+        difference = nan_difference(plan, lg_headers)
+    print(f"  결과 일치   : {'예' if difference is None else '아니오 - ' + difference}")
+    if difference is not None:
+        raise SystemExit(1)
+
+
+def nan_difference(plan, lg_headers):
+    """숫자 열에 실수 NaN을 넣은 행과 빈 값인 행을 보관했다가 꺼냈을 때 다르면 그 설명, 같으면 None"""
+    col_idx = next(lg_col for _, lg_col, converters, _ in plan if converters == (convert_to_numeric,)) - 1
+    width = max(lg_headers.values())
+    nan_row, blank_row = [None] * width, [None] * width
+    nan_row[col_idx] = float("nan")
+    store = RecordStore(plan, lg_headers)
+    store.extend([nan_row, blank_row])
+    nan_value, blank_value = store[0][col_idx], store[1][col_idx]
+    if not (isinstance(nan_value, float) and math.isnan(nan_value)) or blank_value is not None:
+        return f"{col_idx + 1}열 NaN/빈 값: {nan_value!r}, {blank_value!r}"
+    return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""시작 시간 측정: python -X importtime 보고서와 GUI 창이 뜰 때까지의 시간
+
+    python -m benchmarks.bench_startup                 # 5회 실행 중 가장 빠른 실행 기준
+    python -m benchmarks.bench_startup --repeat 10 --top 20
+    python -m benchmarks.bench_startup --output 시작시간.json
+
+대상마다 새 파이썬 프로세스를 --repeat번 실행하여 가장 빠른 실행을 기준으로 출력한다.
+- import: 'import lg_converter'와 GUI 모듈(LG결과_PyQt6.py) 불러오기의 import 합계 시간과 누적 시간이 큰 모듈.
+  인터프리터가 시작할 때 불러오는 모듈(빈 프로세스에서도 불러오는 모듈)은 뺀다.
+- GUI: 모듈 import, 창 표시(show 후 첫 이벤트 처리), 변환 엔진 백그라운드 로딩 완료까지의 시간.
+  화면 없이(QT_QPA_PLATFORM=offscreen) 실행하므로 PyQt6가 필요하다.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GUI_FILE = os.path.join(ROOT, "LG결과_PyQt6.py")
+
+LOAD_GUI = f"""
+import importlib.util
+spec = importlib.util.spec_from_file_location("gui", {GUI_FILE!r})
+gui = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(gui)
+"""
+IMPORT_TARGETS = (("lg_converter", "import lg_converter"), ("GUI 모듈", LOAD_GUI))
+
+GUI_TIMING = f"""
+import json, time
+start = time.perf_counter()
+{LOAD_GUI}
+imported = time.perf_counter()
+from PyQt6.QtWidgets import QApplication
+app = QApplication([])
+window = gui.MainWindow()
+window.show()
+app.processEvents()
+shown = time.perf_counter()
+while window.warmup_thread.ident is None or window.warmup_thread.is_alive():
+    app.processEvents()
+    time.sleep(0.001)
+print(json.dumps({{"import": imported - start, "shown": shown - start, "warm": time.perf_counter() - start}}))
+"""
+GUI_STEPS = (("import", "모듈 import"), ("shown", "창 표시"), ("warm", "엔진 로딩 완료"))
+
+
+def run_python(args, env=None):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+def parse_importtime(stderr, skip=()):
+    """-X importtime 출력 → (최상위 import 합계 초, {모듈: 누적 초}). skip에 있는 모듈은 뺌"""
+    total = 0.0
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, raw_name = line.split("|")
+        name = raw_name.strip()
+        if name in skip:
+            continue
+        seconds = int(cumulative_us) / 1e6
+        cumulative[name] = seconds
+        if len(raw_name) - len(raw_name.lstrip()) == 1:  # 들여쓰기가 없는(최상위) import
+            total += seconds
+    return total, cumulative
+
+
+def import_report(code, repeat, skip):
+    """가장 빠른 실행의 (합계 초, {모듈: 누적 초})"""
+    best = None
+    for _ in range(repeat):
+        result = parse_importtime(run_python(["-X", "importtime", "-c", code]).stderr, skip)
+        if best is None or result[0] < best[0]:
+            best = result
+    return best
+
+
+def gui_report(repeat):
+    """단계별 가장 빠른 시간 (PyQt6가 없으면 None)"""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    best = {}
+    for _ in range(repeat):
+        try:
+            times = json.loads(run_python(["-c", GUI_TIMING], env).stdout)
+        except subprocess.CalledProcessError as e:
+            print(f"  GUI 실행 실패: {e.stderr.strip().splitlines()[-1] if e.stderr.strip() else e}")
+            return None
+        for key, seconds in times.items():
+            best[key] = min(best.get(key, seconds), seconds)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 측정")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 실행 후 가장 빠른 실행 사용")
+    parser.add_argument("--top", type=int, default=15, help="출력할 모듈 수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    _, baseline = parse_importtime(run_python(["-X", "importtime", "-c", "pass"]).stderr)
+    results = {"python": sys.version.split()[0], "import": {}, "gui": None}
+    print(f"import 시간 ({args.repeat}회 중 가장 빠른 실행, 인터프리터 기본 모듈 {len(baseline)}개 제외)")
+    for label, code in IMPORT_TARGETS:
+        total, cumulative = import_report(code, args.repeat, baseline)
+        top = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        results["import"][label] = {"total": total, "top": dict(top)}
+        print(f"  {label}: {total * 1000:.0f}ms")
+        for name, seconds in top:
+            print(f"    {seconds * 1000:8.1f}ms  {name}")
+
+    print(f"GUI 시작 ({args.repeat}회 중 가장 빠른 시간)")
+    gui = results["gui"] = gui_report(args.repeat)
+    if gui:
+        for key, label in GUI_STEPS:
+            print(f"  {label}: {gui[key] * 1000:.0f}ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
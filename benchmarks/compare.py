@@ -0,0 +1,20 @@
+"""벤치마크 결과 비교: 두 방식으로 변환한 행이 값과 타입까지 같은지 확인"""
+import math
+
+
+def same_value(a, b):
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b
+
+
+def first_difference(expected, actual):
+    if len(expected) != len(actual):
+        return f"행 수가 다름: {len(expected)} != {len(actual)}"
+    for row_no, (left, right) in enumerate(zip(expected, actual)):
+        for col_no, (a, b) in enumerate(zip(left, right), 1):
+            if not same_value(a, b):
+                return f"{row_no}번째 행 {col_no}열: {a!r} != {b!r}"
+    return None
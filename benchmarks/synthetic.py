@@ -0,0 +1,55 @@
+"""벤치마크용 합성 병원결과 데이터 생성 (실제 헤더 배치와 값 분포를 흉내냄)"""
+import random
+
+from lg_converter.mappings import COLUMN_MAP, NUMERIC_COLUMNS
+
+CATEGORY_VALUES = ["정상", "이상", "음성", "양성", "1+", "2+", "-", "정상(A)", "경계"]
+
+
+def hospital_headers():
+    """병원결과 3행 헤더: column_map의 모든 원본 헤더 + 매핑되지 않는 열 몇 개"""
+    return list(COLUMN_MAP) + ["비고", "접수번호"]
+
+
+def hospital_row(rnd, index, headers):
+    """병원결과 데이터 한 행 (숫자/숫자 문자열/빈 값/범주형 문자열이 섞인 실제와 비슷한 분포)"""
+    emp_no = 100000 + index
+    ssn = f"{rnd.randint(60, 99):02d}{rnd.randint(1, 12):02d}{rnd.randint(1, 28):02d}-{rnd.choice('1234')}{rnd.randint(0, 999999):06d}"
+    row = []
+    for header in headers:
+        target = COLUMN_MAP.get(header)
+        if target == "EMP_NO":
+            value = emp_no if index % 4 else str(emp_no)
+        elif target == "SSN":
+            value = ssn
+        elif target == "MDC_DATE":
+            value = f"2024-{rnd.randint(3, 5):02d}-{rnd.randint(1, 28):02d}"
+        elif target == "BM01":
+            value = round(rnd.uniform(150, 190), 1)
+        elif target in NUMERIC_COLUMNS:
+            roll = rnd.random()
+            if roll < 0.55:
+                value = round(rnd.uniform(0, 300), 1)
+            elif roll < 0.8:
+                value = f"{rnd.uniform(0, 300):.1f}"
+            elif roll < 0.9:
+                value = rnd.choice([None, "", " "])
+            else:
+                value = rnd.choice(CATEGORY_VALUES)
+        elif target is None:
+            value = f"R{index}"
+        else:
+            value = rnd.choice(CATEGORY_VALUES + [None])
+        row.append(value)
+    return tuple(row)
+
+
+def iter_hospital_rows(count, headers, seed=0):
+    rnd = random.Random(seed)
+    for index in range(count):
+        yield hospital_row(rnd, index, headers)
+
+
+def hospital_rows(count, seed=0):
+    headers = hospital_headers()
+    return headers, list(iter_hospital_rows(count, headers, seed))
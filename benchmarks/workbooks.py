@@ -0,0 +1,96 @@
+"""벤치마크용 합성 병원결과/병원소견/LG결과 템플릿 워크북 생성
+
+실제 파일과 같은 배치로 만든다.
+- 병원결과: 3행 헤더, 4행 단위, 5행부터 데이터
+- 병원소견: 2행 헤더(HO_NO, jumin, A1...), 3행부터 데이터
+- LG결과 템플릿: 3행 헤더, 4행에 지워져야 할 이전 데이터
+
+    python -m benchmarks.workbooks 10000 --dir 폴더
+"""
+import argparse
+import os
+import random
+
+import openpyxl
+
+from lg_converter.mappings import COLUMN_MAP, OPINION_COLUMNS
+
+from .synthetic import CATEGORY_VALUES, hospital_headers, iter_hospital_rows
+
+OPINION_MATCH_RATE = 0.9  # 병원결과 사원 중 소견이 있는 비율
+EXTRA_OPINIONS = 0.01  # 병원결과에 없는 소견 비율
+
+
+def lg_columns():
+    return ["SEQ"] + list(dict.fromkeys(COLUMN_MAP.values())) + ["BM06"] + list(OPINION_COLUMNS.values())
+
+
+def write_template(path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["LG 결과 템플릿"])
+    ws.append(["합성 데이터"])
+    ws.append(lg_columns())
+    ws.append(["이전 데이터"] * 10)
+    wb.save(path)
+
+
+def write_hospital(path, count, seed=0):
+    """병원결과를 write-only로 저장하고 소견 생성을 위해 (사번, 주민번호 앞 8자리) 목록을 반환"""
+    headers = hospital_headers()
+    emp_idx = headers.index(next(h for h, target in COLUMN_MAP.items() if target == "EMP_NO"))
+    ssn_idx = headers.index(next(h for h, target in COLUMN_MAP.items() if target == "SSN"))
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["병원결과"])
+    ws.append([])
+    ws.append(headers)
+    ws.append(["단위"] * len(headers))
+    keys = []
+    for row in iter_hospital_rows(count, headers, seed):
+        ws.append(row)
+        keys.append((row[emp_idx], row[ssn_idx][:8]))
+    wb.save(path)
+    return keys
+
+
+def write_opinion(path, keys, seed=0):
+    rnd = random.Random(seed + 1)
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["병원소견"])
+    ws.append(["HO_NO", "jumin"] + list(OPINION_COLUMNS))
+    # 실제 파일처럼 순서를 섞고 HO_NO 타입(숫자/문자)도 섞음
+    keys = list(keys)
+    rnd.shuffle(keys)
+    for emp_no, ssn in keys:
+        if rnd.random() >= OPINION_MATCH_RATE:
+            continue
+        ho_no = str(emp_no) if rnd.random() < 0.3 else int(emp_no)
+        ws.append([ho_no, ssn] + [rnd.choice(CATEGORY_VALUES) for _ in OPINION_COLUMNS])
+    for index in range(int(len(keys) * EXTRA_OPINIONS)):
+        ws.append([900000 + index, "000000-0"] + ["기타"] * len(OPINION_COLUMNS))
+    wb.save(path)
+
+
+def generate(directory, count, seed=0, reuse=True):
+    """count행짜리 세 파일을 directory에 만들고 (병원결과, 병원소견, 템플릿) 경로를 반환 (이미 있으면 재사용)"""
+    os.makedirs(directory, exist_ok=True)
+    hospital_file = os.path.join(directory, f"병원결과_{count}_{seed}.xlsx")
+    opinion_file = os.path.join(directory, f"병원소견_{count}_{seed}.xlsx")
+    template_file = os.path.join(directory, "LG결과.xlsx")
+    if not (reuse and all(os.path.exists(path) for path in (hospital_file, opinion_file, template_file))):
+        write_template(template_file)
+        keys = write_hospital(hospital_file, count, seed)
+        write_opinion(opinion_file, keys, seed)
+    return hospital_file, opinion_file, template_file
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="합성 병원결과/병원소견/LG결과 템플릿 생성")
+    parser.add_argument("rows", type=int)
+    parser.add_argument("--dir", default=".")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for generated in generate(args.dir, args.rows, args.seed, reuse=False):
+        print(generated)
@@ -0,0 +1,19 @@
+"""병원결과/병원소견 → LG결과 변환 엔진
+
+CLI(main.py), GUI(LG결과_PyQt6.py), 일괄 변환(batch.py)이 모두 이 패키지의 convert()를 호출한다.
+변환 결과는 verify_output()(verify.py)으로 원본과 다시 비교할 수 있다.
+"""
+from .config import MappingConfigError, dump_mapping, load_mapping
+from .engine import ConversionCancelled, ConversionError, ConvertConfig, Report, convert, validate_schema
+from .helpers import (calculate_bm06, convert_emp_no, convert_mdc_date, convert_to_numeric, extract_sex_no,
+                      truncate_ssn)
+from .mappings import COLUMN_MAP, NUMERIC_COLUMNS, OPINION_COLUMNS, RIGHT_ALIGN_COLUMNS
+from .verify import VerifyReport, verify_output
+
+__all__ = [
+    "convert", "validate_schema", "ConvertConfig", "Report", "ConversionError", "ConversionCancelled",
+    "verify_output", "VerifyReport",
+    "load_mapping", "dump_mapping", "MappingConfigError",
+    "convert_emp_no", "convert_to_numeric", "truncate_ssn", "convert_mdc_date", "extract_sex_no", "calculate_bm06",
+    "COLUMN_MAP", "NUMERIC_COLUMNS", "RIGHT_ALIGN_COLUMNS", "OPINION_COLUMNS",
+]
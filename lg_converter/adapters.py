@@ -0,0 +1,245 @@
+"""병원결과/병원소견 입력 어댑터: 헤더 행과 배치를 찾아 여러 시트/파일을 하나의 행 스트림으로 읽음
+
+입력은 파일 하나 또는 여러 개(검사 결과를 나눠 보낸 경우)이며, 파일마다 배치를 찾는 방법(LAYOUTS)은
+- "fixed": 활성 시트의 설정된 헤더 행/데이터 시작 행 (기존 동작)
+- "auto": 모든 시트의 처음 DETECT_ROWS행만 읽어 알려진 열 이름이 가장 많은 행을 헤더 행으로,
+  헤더 다음에서 키 열(사번/HO_NO)에 숫자가 있는 첫 행을 데이터 시작 행으로 정한다.
+  키 열이 없는 시트(표지, 안내문 등)는 건너뛰고, 키 열이 있는 시트가 없으면 fixed와 같이 읽는다.
+DETECTORS에 (파일 경로, InputSpec, 읽기 백엔드) → InputPart 목록 함수를 추가하면 다른 배치도 쓸 수 있다.
+
+찾은 부분(시트)들은 첫 부분을 기준으로 하나의 행 스트림(InputStream)으로 합친다.
+- 첫 부분에 없는 열이 없는 부분: 행을 이어 붙임 (행이 많아 여러 시트/파일로 나눈 경우)
+- 새 열이 있는 부분: 키 열(사번, 양쪽에 있으면 주민번호 앞 8자리까지)로 행을 찾아 새 열을 덧붙임
+  (혈액/소변 검사 등을 다른 파일로 나눠 보낸 경우). 이런 부분만 메모리에 색인하고 나머지는 행을 하나씩 읽는다.
+여러 부분을 이어 붙이면 매칭 리포트의 행 번호는 첫 부분의 데이터 시작 행부터 이어지는 번호이다.
+"""
+import os
+from dataclasses import dataclass
+from itertools import islice
+
+from . import readers
+from .helpers import truncate_ssn
+from .join import make_key
+
+LAYOUTS = ("fixed", "auto")
+DETECT_ROWS = 20  # auto: 시트마다 배치를 찾을 때 읽는 행 수
+
+
+@dataclass
+class InputSpec:
+    """입력 종류(병원결과/병원소견)별 배치 정보"""
+
+    label: str
+    header_row: int  # fixed 배치의 헤더 행
+    data_row: int  # fixed 배치의 데이터 시작 행
+    known_headers: set  # 매핑 설정에 있는 열 이름 (auto: 헤더 행 판단)
+    key_headers: tuple  # 사번 열 이름 후보 (auto: 이 열이 없는 시트는 건너뜀)
+    ssn_headers: tuple = ()  # 주민번호 열 이름 후보 (나눠 보낸 부분을 합칠 때 키에 포함)
+
+
+@dataclass
+class InputPart:
+    """입력의 한 부분 (파일의 시트 하나)"""
+
+    path: str
+    sheet: str  # 시트 이름 (None이면 활성 시트)
+    header_row: int
+    data_row: int
+    headers: dict  # 열 이름 → 열 번호(1부터)
+
+    @property
+    def name(self):
+        base = os.path.basename(self.path)
+        return f"{base}[{self.sheet}]" if self.sheet is not None else base
+
+
+def first_rows(path, count, sheet=None, backend="openpyxl"):
+    """시트의 1~count행 (시트 XML을 직접 읽을 수 없는 파일은 읽기 백엔드로 앞쪽만 읽음)"""
+    try:
+        return readers.read_rows(path, count, sheet)
+    except Exception:
+        reader = readers.open_sheet(path, backend, sheet)
+        try:
+            rows = [tuple(row) for row in islice(reader.iter_rows(), count)]
+        finally:
+            reader.close()
+        return rows + [()] * (count - len(rows))
+
+
+def header_dict(row):
+    return {value: col_idx for col_idx, value in enumerate(row, 1) if value}
+
+
+def detect_layout(rows, spec):
+    """앞쪽 행 목록에서 (헤더 행, 데이터 시작 행, 헤더 딕셔너리)를 찾음. 키 열이 있는 행이 없으면 None"""
+    best = None
+    for row_no, row in enumerate(rows, 1):
+        headers = header_dict(row)
+        key_col = next((headers[name] for name in spec.key_headers if name in headers), None)
+        if key_col is None:
+            continue
+        score = sum(1 for name in headers if name in spec.known_headers)
+        if best is None or score > best[0]:
+            best = (score, row_no, headers, key_col)
+    if best is None:
+        return None
+    _, header_row, headers, key_col = best
+    # 헤더 다음의 단위/설명 행은 키 열에 숫자가 없으므로 건너뜀
+    for row_no in range(header_row + 1, len(rows) + 1):
+        row = rows[row_no - 1]
+        value = row[key_col - 1] if key_col <= len(row) else None
+        if value is not None and any(char.isdigit() for char in str(value)):
+            return header_row, row_no, headers
+    return header_row, header_row + spec.data_row - spec.header_row, headers
+
+
+def fixed_parts(path, spec, backend="openpyxl"):
+    """활성 시트의 설정된 헤더 행 (헤더 행까지만 읽음)"""
+    headers = header_dict(first_rows(path, spec.header_row, None, backend)[-1])
+    return [InputPart(path, None, spec.header_row, spec.data_row, headers)]
+
+
+def auto_parts(path, spec, backend="openpyxl"):
+    """모든 시트에서 처음 DETECT_ROWS행만 읽어 키 열이 있는 시트와 그 배치를 찾음"""
+    try:
+        names, _ = readers.sheet_names(path)
+    except Exception:
+        names = []  # xlsx 구조를 직접 읽을 수 없는 파일
+    parts = []
+    for name in names:
+        layout = detect_layout(first_rows(path, DETECT_ROWS, name, backend), spec)
+        if layout is not None:
+            parts.append(InputPart(path, name, *layout))
+    return parts or fixed_parts(path, spec, backend)
+
+
+DETECTORS = {"fixed": fixed_parts, "auto": auto_parts}
+
+
+def scan(paths, spec, layout="fixed", backend="openpyxl"):
+    """파일마다 배치를 찾아 InputPart 목록을 반환 (파일마다 앞쪽 몇 행만 읽음)"""
+    if layout not in DETECTORS:
+        raise ValueError(f"알 수 없는 입력 배치: {layout} ({', '.join(DETECTORS)})")
+    parts = []
+    for path in paths:
+        parts += DETECTORS[layout](path, spec, backend)
+    return parts
+
+
+def unified_headers(parts):
+    """InputStream과 같은 규칙으로 합친 열 이름 → 열 번호 (파일을 열지 않음)"""
+    headers = dict(parts[0].headers)
+    width = max(headers.values(), default=0)
+    for part in parts[1:]:
+        for name in part.headers:
+            if name not in headers:
+                width += 1
+                headers[name] = width
+    return headers
+
+
+class InputStream:
+    """부분들을 합친 하나의 입력.
+
+    headers(합친 열 이름 → 열 번호), first_row_no(첫 데이터 행 번호), total(예상 행 수, 알 수 없으면 None),
+    rows()(데이터 행 값 튜플 제너레이터), close()
+    """
+
+    def __init__(self, parts, spec, backend="openpyxl", match_ssn=True, log=print):
+        self.spec = spec
+        self.backend = backend
+        self.match_ssn = match_ssn
+        self.log = log
+        self.first_row_no = parts[0].data_row
+        self.headers = dict(parts[0].headers)
+        self._width = max(self.headers.values(), default=0)  # 이어 붙이는 부분의 너비
+        self._appended = []  # (부분, 열 위치 바꾸기 [(원래 위치, 합친 위치)] 또는 None)
+        self._merged = []  # (부분, 덧붙일 열 이름 목록)
+        width = self._width
+        for part in parts:
+            new_names = [name for name in part.headers if name not in self.headers]
+            if part is parts[0] or not new_names:
+                same = all(self.headers[name] == col_idx for name, col_idx in part.headers.items())
+                moves = None if same else [(col_idx - 1, self.headers[name] - 1)
+                                           for name, col_idx in part.headers.items()]
+                self._appended.append((part, moves))
+            else:
+                if not any(name in part.headers for name in spec.key_headers):
+                    raise ValueError(f"{spec.label} {part.name}: 사번 열이 없어 다른 부분과 합칠 수 없습니다.")
+                for name in new_names:
+                    width += 1
+                    self.headers[name] = width
+                self._merged.append((part, new_names))
+        self._sheets = []
+        try:
+            for part, _ in self._appended:
+                self._sheets.append(readers.open_sheet(part.path, backend, part.sheet))
+        except Exception:
+            self.close()
+            raise
+        # read-only openpyxl 시트는 파일에 크기 정보(<dimension>)가 없으면 max_row가 None: 행 수를 세려면
+        # 시트를 한 번 더 읽어야 하므로 전체 행 수를 모름(None)으로 두고 진행률 표시에서 처리한다.
+        max_rows = [sheet.max_row for sheet in self._sheets]
+        self.total = None if None in max_rows else sum(
+            max(max_row - part.data_row + 1, 0) for max_row, (part, _) in zip(max_rows, self._appended))
+
+    def _key_function(self, headers, use_ssn):
+        emp_no_idx = next(headers[name] - 1 for name in self.spec.key_headers if name in headers)
+        ssn_idx = next((headers[name] - 1 for name in self.spec.ssn_headers if name in headers), None)
+        use_ssn = use_ssn and ssn_idx is not None
+
+        def key(row):
+            emp_no = row[emp_no_idx] if emp_no_idx < len(row) else None
+            ssn = row[ssn_idx] if use_ssn and ssn_idx < len(row) else None
+            return make_key(emp_no, truncate_ssn(ssn), use_ssn)
+        return key, use_ssn
+
+    def _supplement(self, part, names):
+        """덧붙일 부분을 읽어 (합친 행의 키 함수, 키 → 덧붙일 값 튜플, 값이 없을 때의 빈 튜플, 부분 이름)"""
+        base_has_ssn = any(name in self.headers and self.headers[name] <= self._width
+                           for name in self.spec.ssn_headers)
+        part_key, use_ssn = self._key_function(part.headers, self.match_ssn and base_has_ssn)
+        row_key, _ = self._key_function(self.headers, use_ssn)
+        indexes = [part.headers[name] - 1 for name in names]
+        values = {}
+        sheet = readers.open_sheet(part.path, self.backend, part.sheet)
+        try:
+            for row in islice(sheet.iter_rows(), part.data_row - 1, None):
+                key = part_key(row)
+                if key is not None:
+                    values[key] = tuple(row[idx] if idx < len(row) else None for idx in indexes)
+        finally:
+            sheet.close()
+        return row_key, values, (None,) * len(names), part.name
+
+    def rows(self):
+        supplements = [self._supplement(part, names) for part, names in self._merged]
+        used = [set() for _ in supplements]
+        for sheet, (part, moves) in zip(self._sheets, self._appended):
+            for row in islice(sheet.iter_rows(), part.data_row - 1, None):
+                if moves is not None:
+                    moved = [None] * self._width
+                    for src_idx, dst_idx in moves:
+                        if src_idx < len(row):
+                            moved[dst_idx] = row[src_idx]
+                    row = moved
+                if supplements:
+                    row = tuple(row) + (None,) * (self._width - len(row))
+                    for (row_key, values, empty, _), keys in zip(supplements, used):
+                        key = row_key(row)
+                        extra = values.get(key)
+                        if extra is None:
+                            extra = empty
+                        else:
+                            keys.add(key)
+                        row += extra
+                yield row
+        for (_, values, _, name), keys in zip(supplements, used):
+            if len(values) > len(keys):
+                self.log(f"경고: {self.spec.label} {name}의 {len(values) - len(keys)}명은 "
+                         f"다른 부분에 같은 키의 행이 없어 합치지 못했습니다.")
+
+    def close(self):
+        for sheet in self._sheets:
+            sheet.close()
+        self._sheets = []
@@ -0,0 +1,300 @@
+"""외부 매핑 설정 파일(JSON/YAML/CSV) 로드, 검증
+
+설정 파일 형식 (JSON 예, 생략한 항목은 mappings.py의 기본값 사용):
+    {
+        "column_map": {"사원번호": "EMP_NO", "주민등록번호": "SSN", ...},
+        "opinion_columns": {"A1": "MDC_DECI", ...},
+        "numeric_columns": ["MDC_DATE", "BM01", ...],
+        "right_align_columns": ["CE01", "CE02", "CE03"],
+        "column_formats": {"MDC_DATE": "0000-00-00"},
+        "numeric_format": "0.0"
+    }
+
+column_formats는 LG결과 열별 엑셀 표시 형식, numeric_format은 column_formats에 없는
+numeric_columns 열에 공통으로 쓸 표시 형식이다 (둘 다 생략하면 서식 없음, numeric_format은 null도 서식 없음).
+
+YAML도 같은 구조이며(PyYAML 필요), CSV는 "구분,원본,대상" 세 열로 적는다.
+    column,사원번호,EMP_NO
+    opinion,A1,MDC_DECI
+    numeric,,BM01
+    right_align,,CE01
+    format,MDC_DATE,0000-00-00
+    numeric_format,,0.0
+
+검증을 통과한 매핑은 사용자 캐시 폴더(lg_converter/mappings)에 JSON으로 저장해 두고, 다음 실행에서
+설정 파일 내용의 sha256(과 확장자, 기본 매핑)이 같으면 파싱과 검증 없이 그대로 쓴다.
+측정(139개 열 매핑): 파싱+검증은 JSON 0.25ms, CSV 0.6ms, YAML 13.5ms로, 캐시는 주로 YAML에서 이득이 있다.
+캐시 폴더에 쓸 수 없으면 알리지 않고 매번 파싱한다.
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+
+from .engine import ConversionError
+from .files import replace_file, user_cache_dir
+from .mappings import COLUMN_MAP, NUMERIC_COLUMNS, OPINION_COLUMNS, RIGHT_ALIGN_COLUMNS
+
+COMPUTED_COLUMNS = {"BM06"}  # 매핑 없이 계산으로 채워지는 LG결과 열
+
+MAP_SECTIONS = ("column_map", "opinion_columns")
+SET_SECTIONS = ("numeric_columns", "right_align_columns")
+FORMAT_SECTION = "column_formats"
+NUMERIC_FORMAT = "numeric_format"
+CACHE_VERSION = 1
+CSV_SECTIONS = {
+    "column": "column_map",
+    "opinion": "opinion_columns",
+    "numeric": "numeric_columns",
+    "right_align": "right_align_columns",
+    "format": FORMAT_SECTION,
+}
+
+
+class MappingConfigError(ConversionError):
+    """매핑 설정 파일에 중복/충돌 등 문제가 있음"""
+
+    def __init__(self, path, problems):
+        self.path = path
+        self.problems = problems
+        super().__init__(f"매핑 설정 오류 ({path}):\n" + "\n".join(f"  - {problem}" for problem in problems))
+
+
+class _Pairs(list):
+    """중복 키를 검사할 수 있도록 파일에 적힌 순서대로 보관한 (키, 값) 목록"""
+
+
+def _parse_json(text):
+    return json.loads(text, object_pairs_hook=_Pairs)
+
+
+def _parse_yaml(text):
+    try:
+        import yaml
+    except ImportError:
+        raise ConversionError("YAML 매핑 설정을 읽으려면 PyYAML이 필요합니다 (pip install pyyaml)") from None
+
+    class PairsLoader(yaml.SafeLoader):
+        pass
+
+    def construct_pairs(loader, node):
+        return _Pairs(loader.construct_pairs(node, deep=True))
+
+    PairsLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, construct_pairs)
+    return yaml.load(text, Loader=PairsLoader)
+
+
+def _parse_csv(text):
+    sections = {}
+    for line_no, row in enumerate(csv.reader(io.StringIO(text)), 1):
+        if not row or not "".join(row).strip() or row[0].strip().startswith("#") or row[0].strip() == "구분":
+            continue
+        section = CSV_SECTIONS.get(row[0].strip(), row[0].strip())
+        source = row[1].strip() if len(row) > 1 else ""
+        target = row[2].strip() if len(row) > 2 else ""
+        if section in SET_SECTIONS:
+            sections.setdefault(section, []).append(target or source)
+        elif section == NUMERIC_FORMAT:
+            sections.setdefault(section, target or source)
+        else:
+            sections.setdefault(section, _Pairs()).append((source, target))
+    return _Pairs(sections.items())
+
+
+def parse_mapping_file(path, raw):
+    """확장자에 따라 설정 파일을 (섹션 이름, 값) 목록으로 파싱"""
+    text = raw.decode("utf-8-sig")
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        return _parse_json(text)
+    if ext in (".yaml", ".yml"):
+        return _parse_yaml(text)
+    if ext == ".csv":
+        return _parse_csv(text)
+    raise ConversionError(f"지원하지 않는 매핑 설정 형식입니다: {path} (json, yaml, csv)")
+
+
+def validate_mapping(path, sections):
+    """중복 키, 대상 열 충돌, 알 수 없는 항목을 검사하고 (매핑 딕셔너리, 경고 목록)을 반환"""
+    problems = []
+    warnings = []
+    if not isinstance(sections, _Pairs):
+        raise MappingConfigError(path, ["최상위는 column_map 등의 항목을 가진 객체여야 합니다."])
+
+    mapping = {
+        "column_map": dict(COLUMN_MAP),
+        "opinion_columns": dict(OPINION_COLUMNS),
+        "numeric_columns": set(NUMERIC_COLUMNS),
+        "right_align_columns": set(RIGHT_ALIGN_COLUMNS),
+        FORMAT_SECTION: {},
+        NUMERIC_FORMAT: None,
+    }
+    seen_sections = set()
+    for section, value in sections:
+        if section in seen_sections:
+            problems.append(f"'{section}' 항목이 두 번 이상 정의되었습니다.")
+        seen_sections.add(section)
+
+        if section in MAP_SECTIONS:
+            if not isinstance(value, _Pairs):
+                problems.append(f"'{section}'은(는) 원본 헤더 → LG결과 헤더 객체여야 합니다.")
+                continue
+            section_map = {}
+            for source, target in value:
+                if not isinstance(source, str) or not source or not isinstance(target, str) or not target:
+                    problems.append(f"{section}: 비어 있거나 문자열이 아닌 항목 {source!r} → {target!r}")
+                elif source in section_map:
+                    problems.append(f"{section}: 원본 헤더 '{source}'가 중복됨 "
+                                    f"('{section_map[source]}'와 '{target}')")
+                else:
+                    section_map[source] = target
+            mapping[section] = section_map
+        elif section in SET_SECTIONS:
+            if not isinstance(value, list) or any(not isinstance(name, str) or not name for name in value):
+                problems.append(f"'{section}'은(는) LG결과 헤더 문자열 목록이어야 합니다.")
+                continue
+            duplicates = sorted({name for name in value if value.count(name) > 1})
+            if duplicates:
+                warnings.append(f"{section}: 중복된 항목 {duplicates}")
+            mapping[section] = set(value)
+        elif section == FORMAT_SECTION:
+            if not isinstance(value, _Pairs):
+                problems.append(f"'{section}'은(는) LG결과 헤더 → 표시 형식 객체여야 합니다.")
+                continue
+            formats = {}
+            for column, number_format in value:
+                if not isinstance(column, str) or not column or not isinstance(number_format, str) \
+                        or not number_format:
+                    problems.append(f"{section}: 비어 있거나 문자열이 아닌 항목 {column!r} → {number_format!r}")
+                elif column in formats:
+                    problems.append(f"{section}: '{column}'의 표시 형식이 중복됨")
+                else:
+                    formats[column] = number_format
+            mapping[section] = formats
+        elif section == NUMERIC_FORMAT:
+            if value is not None and (not isinstance(value, str) or not value):
+                problems.append(f"'{section}'은(는) 표시 형식 문자열 또는 null이어야 합니다.")
+                continue
+            mapping[section] = value
+        else:
+            sections_list = MAP_SECTIONS + SET_SECTIONS + (FORMAT_SECTION, NUMERIC_FORMAT)
+            problems.append(f"알 수 없는 항목 '{section}' (사용 가능: {', '.join(sections_list)})")
+
+    # 서로 다른 원본이 같은 LG결과 열에 쓰는 충돌
+    targets = {}
+    for section in MAP_SECTIONS:
+        for source, target in mapping[section].items():
+            if target in targets:
+                problems.append(f"LG결과 열 '{target}'에 {targets[target]}와 {section}['{source}']가 모두 매핑됨")
+            else:
+                targets[target] = f"{section}['{source}']"
+
+    for section in SET_SECTIONS + (FORMAT_SECTION,):
+        unknown = sorted(set(mapping[section]) - set(targets) - COMPUTED_COLUMNS)
+        if unknown:
+            warnings.append(f"{section}: 매핑 대상이 아닌 열 {unknown}")
+
+    if problems:
+        raise MappingConfigError(path, problems)
+    return mapping, warnings
+
+
+def cache_path(path, raw):
+    """설정 파일 내용(raw)의 sha256과 확장자, 기본 매핑으로 정한 캐시 파일 경로"""
+    digest = hashlib.sha256(raw)
+    defaults = (CACHE_VERSION, os.path.splitext(path)[1].lower(), sorted(COLUMN_MAP.items()),
+                sorted(OPINION_COLUMNS.items()), sorted(NUMERIC_COLUMNS), sorted(RIGHT_ALIGN_COLUMNS))
+    digest.update(repr(defaults).encode("utf-8"))
+    return os.path.join(user_cache_dir("mappings"), f"{digest.hexdigest()}.json")
+
+
+def _read_cache(cache_file):
+    """캐시된 (매핑 딕셔너리, 경고 목록). 없거나 읽을 수 없으면 None"""
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["version"] != CACHE_VERSION:
+            return None
+        mapping = cached["mapping"]
+        for section in SET_SECTIONS:
+            mapping[section] = set(mapping[section])
+        return mapping, list(cached["warnings"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(cache_file, mapping, warnings):
+    data = {"version": CACHE_VERSION, "warnings": warnings,
+            "mapping": {section: sorted(value) if section in SET_SECTIONS else value
+                        for section, value in mapping.items()}}
+
+    def write(temp_file):
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        replace_file(cache_file, write)
+    except OSError:
+        pass
+
+
+def load_mapping(path, log=print, use_cache=True):
+    """매핑 설정 파일을 읽어 ConvertConfig에 넘길 수 있는 딕셔너리로 반환 (검증 실패 시 MappingConfigError)
+
+    use_cache가 참이면 같은 내용의 파일을 이전에 검증한 결과(캐시)를 쓰고, 없으면 검증한 결과를 캐시에 저장한다.
+    """
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        raise ConversionError(f"매핑 설정 파일을 찾을 수 없습니다: {path}") from None
+
+    cache_file = cache_path(path, raw) if use_cache else None
+    cached = _read_cache(cache_file) if cache_file else None
+    if cached is not None:
+        mapping, warnings = cached
+    else:
+        try:
+            sections = parse_mapping_file(path, raw)
+        except ConversionError:
+            raise
+        except Exception as e:
+            raise MappingConfigError(path, [f"파일을 해석할 수 없습니다: {e}"]) from e
+        mapping, warnings = validate_mapping(path, sections)
+        if cache_file:
+            _write_cache(cache_file, mapping, warnings)
+    for warning in warnings:
+        log(f"경고: {warning}")
+    return mapping
+
+
+def mapping_differences(mapping, config):
+    """load_mapping 결과와 ConvertConfig의 매핑 항목 중 값이 다른 항목 이름 목록"""
+    differences = []
+    for section in MAP_SECTIONS + (FORMAT_SECTION, NUMERIC_FORMAT):
+        if mapping[section] != getattr(config, section):
+            differences.append(section)
+    for section in SET_SECTIONS:
+        if set(mapping[section]) != set(getattr(config, section)):
+            differences.append(section)
+    return differences
+
+
+def dump_mapping(path, config):
+    """현재 설정의 매핑을 편집용 JSON 파일로 저장하고, 다시 읽어 같은 설정이 되는지 확인"""
+    data = {
+        "column_map": config.column_map,
+        "opinion_columns": config.opinion_columns,
+        "numeric_columns": sorted(config.numeric_columns),
+        "right_align_columns": sorted(config.right_align_columns),
+        "column_formats": config.column_formats,
+        "numeric_format": config.numeric_format,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    differences = mapping_differences(load_mapping(path, log=lambda message: None, use_cache=False), config)
+    if differences:
+        raise MappingConfigError(path, [f"저장한 파일을 다시 읽은 '{section}' 값이 현재 설정과 다릅니다."
+                                        for section in differences])
@@ -0,0 +1,613 @@
+"""변환 엔진: CLI(main.py), GUI(LG결과_PyQt6.py), 일괄 변환(batch.py)이 모두 호출하는 convert()"""
+import os
+import time
+from copy import copy
+from dataclasses import dataclass, field
+
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+
+from . import adapters, parallel, readers, template_cache
+from .join import (add_opinion, format_key, index_rows, iter_merged_rows, join_indexed, join_report_path,
+                   make_key, write_join_report)
+from .logs import DEBUG, INFO, LogSink, trace_callback
+from .memo import DEFAULT_SIZE as MEMO_SIZE, ConverterMemo
+from .mappings import COLUMN_MAP, NUMERIC_COLUMNS, OPINION_COLUMNS, RIGHT_ALIGN_COLUMNS
+from .plan import build_transform_plan, iter_transformed_rows
+from .profiling import MEMORY_UNAVAILABLE, profile_to, stage
+from .records import RecordStore
+from .schema import check_headers
+from .styles import apply_column_styles, apply_style, column_styles, copy_column_dimensions
+from .writers import FLAT_FORMATS, open_flat_writer, output_format
+
+
+class ConversionError(Exception):
+    """입력 파일을 열 수 없거나 필요한 구조가 없어 변환을 진행할 수 없음"""
+
+
+class ConversionCancelled(Exception):
+    """should_cancel 콜백이 참을 반환하여 변환이 중단됨 (결과 파일은 저장되지 않음)"""
+
+
+@dataclass
+class ConvertConfig:
+    """변환 설정. 프로세스 풀 작업으로 넘길 수 있도록 값만 담는다."""
+
+    column_map: dict = field(default_factory=lambda: dict(COLUMN_MAP))
+    numeric_columns: set = field(default_factory=lambda: set(NUMERIC_COLUMNS))
+    right_align_columns: set = field(default_factory=lambda: set(RIGHT_ALIGN_COLUMNS))
+    opinion_columns: dict = field(default_factory=lambda: dict(OPINION_COLUMNS))
+    column_formats: dict = field(default_factory=dict)  # LG결과 열 → 표시 형식 (예: {"MDC_DATE": "0000-00-00"})
+    numeric_format: str = None  # column_formats에 없는 numeric_columns 열의 표시 형식 (예: "0.0")
+    match_ssn: bool = True  # HO_NO=EMP_NO에 더해 jumin=SSN까지 같아야 소견을 매핑
+    stream: bool = False  # read-only/write-only 스트리밍 모드
+    keep_checkpoints: bool = False  # 디버깅용 단계별 중간 결과 파일 저장 (stream과 함께 쓰면 ConversionError)
+    verbose: bool = False  # 소견이 매핑된 행마다 상세 로그 (DEBUG 수준, log 콜백으로 출력)
+    trace_file: str = None  # 지정하면 행별 상세 로그를 log 대신 이 파일에 저장 (첫 항목이 나올 때 생성)
+    join_report: bool = True  # 미매칭/중복 키가 있으면 결과 파일 옆에 전체 목록 CSV 저장
+    chunk_size: int = parallel.DEFAULT_CHUNK_SIZE  # 병렬 변환이 한 번에 작업 프로세스로 보내는 행 수
+    memo_size: int = MEMO_SIZE  # 열별 변환 결과 캐시 크기 (0이면 사용 안 함, 스칼라 직렬 변환에만 적용)
+    workers: int = 1  # 행 변환 프로세스 수 (1: 현재 프로세스에서 직렬 변환, 0: CPU 수)
+    hospital_header_row: int = 3
+    hospital_data_row: int = 5
+    opinion_header_row: int = 2
+    opinion_data_row: int = 3
+    input_layout: str = "fixed"  # 병원결과/병원소견 배치: "fixed"(위의 행 번호), "auto"(헤더 행/시트 자동 탐지, adapters.py)
+    template_header_row: int = 3
+    profile_file: str = None  # 지정하면 변환 전체를 cProfile로 측정하여 pstats 파일로 저장
+    incremental: bool = False  # 바뀐 사원이 없을 때만 변환을 건너뜀, 있으면 전체를 이전 행 순서로 다시 씀 (incremental.py)
+    output_format: str = None  # "xlsx", "csv", "parquet" (None이면 결과 파일 확장자로 결정)
+    template_cache: bool = True  # 헤더 행까지만 남긴 템플릿 사본과 헤더를 캐시하여 재사용 (template_cache.py)
+    reader: str = "openpyxl"  # 병원결과/병원소견 읽기: "openpyxl", "calamine"(빠르지만 readers 모듈의 차이 참고), "auto"
+    schema_check: bool = True  # 변환 전에 세 파일의 헤더 행만 읽어 필수 열이 없으면 바로 중단 (schema.py)
+
+
+@dataclass
+class Report:
+    """변환 결과 요약"""
+
+    output_file: str
+    rows: int = 0
+    opinion: int = 0
+    matched: int = 0
+    unmatched_opinion: int = 0
+    unmatched_row_keys: list = field(default_factory=list)  # (병원결과 행 번호, 매칭 키)
+    unmatched_opinion_keys: list = field(default_factory=list)  # (병원소견 행 번호, 매칭 키)
+    duplicate_opinion_keys: dict = field(default_factory=dict)  # 매칭 키 → 병원소견 행 번호 목록
+    duplicate_row_keys: dict = field(default_factory=dict)  # 매칭 키 → 병원결과 행 번호 목록
+    join_report_file: str = None
+    trace_file: str = None  # 행별 상세 로그를 저장한 파일 (저장한 항목이 없으면 None)
+    memo: object = None  # 열별 변환 캐시 (memo.ConverterMemo, 사용하지 않으면 None)
+    schema: object = None  # 변환 전 헤더 검사 결과 (schema.SchemaReport)
+    delta: dict = None  # 증분 변환 시 added/changed/removed/unchanged 사원 수 (전체 변환이면 None)
+    stages: dict = field(default_factory=dict)  # 단계 이름 → profiling.StageStat
+    elapsed: float = 0.0
+
+    @property
+    def unmatched_rows(self):
+        return self.rows - self.matched
+
+    @property
+    def timings(self):
+        return {name: stat.seconds for name, stat in self.stages.items()}
+
+    def summary_lines(self):
+        lines = [
+            f"변환 행 수: {self.rows}, 소견 {self.opinion}건 중 매칭 {self.matched}행",
+            f"미매칭: 결과 {self.unmatched_rows}행, 소견 {self.unmatched_opinion}건",
+        ]
+        row_samples = [format_key(key) for _, key in self.unmatched_row_keys[:SAMPLE_SIZE]]
+        if row_samples:
+            lines.append(f"  결과 미매칭 예: {row_samples}")
+        opinion_samples = [format_key(key) for _, key in self.unmatched_opinion_keys[:SAMPLE_SIZE]]
+        if opinion_samples:
+            lines.append(f"  소견 미매칭 예: {opinion_samples}")
+        if self.duplicate_opinion_keys or self.duplicate_row_keys:
+            lines.append(f"중복 키: 소견 {len(self.duplicate_opinion_keys)}개 (마지막 행 사용), "
+                         f"결과 {len(self.duplicate_row_keys)}개")
+        if self.join_report_file:
+            lines.append(f"미매칭/중복 전체 목록: {self.join_report_file}")
+        if self.trace_file:
+            lines.append(f"행별 상세 로그: {self.trace_file}")
+        if self.delta is not None:
+            lines.append(f"증분 변환: 추가 {self.delta['added']}명, 변경 {self.delta['changed']}명, "
+                         f"삭제 {self.delta['removed']}명, 그대로 {self.delta['unchanged']}명")
+        if self.memo is not None:
+            lines.append(self.memo.summary_line())
+        if self.stages:
+            lines.append("단계별 시간:")
+            lines.extend(stat.line(name) for name, stat in self.stages.items())
+            if all(stat.memory_mb is None for stat in self.stages.values()):
+                lines.append(MEMORY_UNAVAILABLE)
+        rate = self.rows / self.elapsed if self.elapsed > 0 else 0
+        lines.append(f"전체 {self.elapsed:.2f}초 ({rate:,.0f}행/초) → {self.output_file}")
+        return lines
+
+
+SAMPLE_SIZE = 5
+
+
+def open_workbook(path, label, **kwargs):
+    try:
+        return openpyxl.load_workbook(path, **kwargs)
+    except FileNotFoundError:
+        raise ConversionError(f"{label} 파일을 찾을 수 없습니다: {path}") from None
+    except Exception as e:
+        raise ConversionError(f"{label} 파일 처리 중 문제 발생: {path} ({e})") from e
+
+
+def input_paths(path):
+    """입력 파일 경로 목록 (파일 하나 또는 검사 결과를 나눠 보낸 파일 여러 개)"""
+    return [path] if isinstance(path, (str, os.PathLike)) else list(path)
+
+
+def hospital_spec(config):
+    def sources(lg_name):
+        return tuple(header for header, target in config.column_map.items() if target == lg_name)
+    return adapters.InputSpec("병원결과", config.hospital_header_row, config.hospital_data_row, set(config.column_map),
+                              sources("EMP_NO"), sources("SSN"))
+
+
+def opinion_spec(config):
+    return adapters.InputSpec("병원소견", config.opinion_header_row, config.opinion_data_row,
+                              set(config.opinion_columns) | {"HO_NO", "jumin"}, ("HO_NO",), ("jumin",))
+
+
+def scan_input(path, spec, config):
+    """입력 파일들의 배치(adapters.InputPart 목록)를 찾음 (파일마다 앞쪽 몇 행만 읽음)"""
+    paths = input_paths(path)
+    for item in paths:
+        if not os.path.exists(item):
+            raise ConversionError(f"{spec.label} 파일을 찾을 수 없습니다: {item}")
+    try:
+        return adapters.scan(paths, spec, config.input_layout, config.reader)
+    except (ImportError, ValueError) as e:
+        raise ConversionError(str(e)) from None
+    except Exception as e:
+        raise ConversionError(f"{spec.label} 파일 처리 중 문제 발생: {', '.join(map(str, paths))} ({e})") from e
+
+
+def open_input(path, spec, config, log):
+    """입력 파일들을 하나의 행 스트림(adapters.InputStream)으로 엶"""
+    parts = scan_input(path, spec, config)
+    if config.input_layout != "fixed" or len(parts) > 1:
+        log(f"{spec.label} 입력: " + ", ".join(
+            f"{part.name} (헤더 {part.header_row}행, 데이터 {part.data_row}행부터)" for part in parts))
+    try:
+        return adapters.InputStream(parts, spec, config.reader, config.match_ssn, log)
+    except (ImportError, ValueError) as e:
+        raise ConversionError(str(e)) from None
+    except Exception as e:
+        raise ConversionError(f"{spec.label} 파일 처리 중 문제 발생: {', '.join(part.name for part in parts)} ({e})") from e
+
+
+def track_rows(rows, total, progress=None, should_cancel=None):
+    """행마다 취소 여부를 확인하고 진행률 콜백을 호출 (total은 전체 행 수, 알 수 없으면 None)"""
+    for done, row in enumerate(rows, 1):
+        if should_cancel and should_cancel():
+            raise ConversionCancelled()
+        yield row
+        if progress:
+            progress(done, total)
+
+
+def load_hospital(hospital_file, config, log=print):
+    """병원결과를 read-only로 읽어 (헤더 딕셔너리, 데이터 행 목록, 첫 데이터 행 번호)를 반환"""
+    source = open_input(hospital_file, hospital_spec(config), config, log)
+    try:
+        return source.headers, list(source.rows()), source.first_row_no
+    finally:
+        source.close()
+
+
+def load_template(template_file, config):
+    """템플릿을 불러와 헤더 다음 행부터 데이터를 삭제하고 (워크북, 시트, 헤더)를 반환.
+
+    config.template_cache가 참이면 캐시된 사본(이미 헤더 행까지만 남은 템플릿)을 불러오고,
+    캐시가 없거나 템플릿이 바뀌었으면 원본을 정리한 뒤 사본을 캐시에 저장한다.
+    """
+    layout = template_cache.lookup(template_file, config.template_header_row) if config.template_cache else None
+    if layout is not None:
+        wb_lg = open_workbook(layout.path, "LG결과 템플릿")
+        return wb_lg, wb_lg.active, layout.lg_headers
+
+    wb_lg = open_workbook(template_file, "LG결과 템플릿")
+    ws_lg = wb_lg.active
+    ws_lg.delete_rows(config.template_header_row + 1, ws_lg.max_row)
+    lg_headers = {cell.value: col_idx for col_idx, cell in enumerate(ws_lg[config.template_header_row], 1) if cell.value}
+    if config.template_cache:
+        template_cache.store(template_file, config.template_header_row, wb_lg, lg_headers)
+    return wb_lg, ws_lg, lg_headers
+
+
+def read_header_row(path, label, header_row):
+    """헤더 행만 읽어 헤더 딕셔너리를 반환 (readers.read_row, 실패하면 openpyxl read-only)"""
+    if not os.path.exists(path):
+        raise ConversionError(f"{label} 파일을 찾을 수 없습니다: {path}")
+    try:
+        row = readers.read_row(path, header_row)
+    except Exception:
+        pass  # 시트 XML을 직접 읽을 수 없는 파일은 openpyxl로 읽음
+    else:
+        return {value: col_idx for col_idx, value in enumerate(row, 1) if value}
+    wb = open_workbook(path, label, read_only=True)
+    try:
+        for row in wb.active.iter_rows(min_row=header_row, max_row=header_row, values_only=True):
+            return {value: col_idx for col_idx, value in enumerate(row, 1) if value}
+        return {}
+    finally:
+        wb.close()
+
+
+def read_template_headers(template_file, header_row, use_cache=True):
+    """템플릿 헤더 딕셔너리 (캐시가 유효하면 파일을 열지 않고, 아니면 헤더 행만 read-only로 읽음)"""
+    layout = template_cache.lookup(template_file, header_row) if use_cache else None
+    if layout is not None:
+        return layout.lg_headers
+    return read_header_row(template_file, "LG결과 템플릿", header_row)
+
+
+def validate_schema(hospital_file, opinion_file, template_file, config=None, report=None, log=print):
+    """세 파일의 헤더 행만 읽어 매핑 설정과 비교하고 schema.SchemaReport를 반환.
+
+    필수 열이 없으면 변환 전에 ConversionError가 발생한다. convert()가 먼저 호출하며 단독으로도 쓸 수 있다.
+    """
+    config = config or ConvertConfig()
+    report = report or Report(None)
+    with stage(report, "schema"):
+        lg_headers = read_template_headers(template_file, config.template_header_row, config.template_cache)
+        schema = check_headers(adapters.unified_headers(scan_input(hospital_file, hospital_spec(config), config)),
+                               adapters.unified_headers(scan_input(opinion_file, opinion_spec(config), config)),
+                               lg_headers, config)
+    report.schema = schema
+    for line in schema.lines():
+        log(("오류: " if line.startswith("필수") else "경고: ") + line)
+    if not schema.ok:
+        missing = ", ".join(f"{source} {name}" for source, name in schema.missing_required)
+        raise ConversionError(f"필수 열이 없어 변환할 수 없습니다: {missing} (헤더 행 번호와 매핑 설정을 확인하세요)")
+    return schema
+
+
+def copy_template_header(template_file, ws_out, config):
+    """템플릿의 열 정보(너비, 열 서식 등)와 헤더 행까지를 스타일과 함께 write-only 시트로 복사하고 헤더를 반환
+
+    write-only 시트는 첫 행을 쓸 때 열 정보를 저장하므로 열 정보를 먼저 복사한다.
+    템플릿은 load_template으로 불러오므로 템플릿 캐시(헤더 행까지만 남긴 사본)가 있으면 그 사본을 읽는다.
+    """
+    wb_template, ws_template, lg_headers = load_template(template_file, config)
+    copy_column_dimensions(ws_template, ws_out)
+    for row in ws_template.iter_rows(min_row=1, max_row=config.template_header_row):
+        out_row = []
+        for cell in row:
+            if cell.has_style:
+                out_cell = WriteOnlyCell(ws_out, value=cell.value)
+                out_cell.font = copy(cell.font)
+                out_cell.fill = copy(cell.fill)
+                out_cell.border = copy(cell.border)
+                out_cell.alignment = copy(cell.alignment)
+                out_cell.number_format = cell.number_format
+                out_row.append(out_cell)
+            else:
+                out_row.append(cell.value)
+        ws_out.append(out_row)
+    wb_template.close()
+    return lg_headers
+
+
+def select_transform(config, log, report):
+    """설정에 맞는 행 변환 함수 (workers가 1이 아니면 병렬 변환).
+
+    직렬 변환이면 열별 변환 캐시를 쓰고 report.memo에 통계를 남긴다.
+    """
+    if config.workers is None or config.workers < 0:
+        raise ConversionError(f"workers는 0 이상이어야 합니다: {config.workers}")
+    if config.chunk_size < 1:
+        raise ConversionError(f"chunk_size는 1 이상이어야 합니다: {config.chunk_size}")
+    workers = config.workers or os.cpu_count() or 1
+    if workers > 1:
+        return lambda rows, plan, lg_headers: parallel.iter_transformed_rows(rows, plan, lg_headers, workers,
+                                                                             config.chunk_size)
+    if config.memo_size:
+        report.memo = ConverterMemo(config.memo_size)
+    return lambda rows, plan, lg_headers: iter_transformed_rows(rows, plan, lg_headers, report.memo)
+
+
+def load_opinion_index(opinion_file, lg_headers, config, report, log):
+    """병원소견을 read-only로 읽어 매칭 키별로 (행 번호, 매핑할 값) 색인과 대상 열 목록을 반환.
+
+    같은 키가 여러 번 나오면 마지막 행을 사용하고 report.duplicate_opinion_keys에 기록한다.
+    """
+    source = open_input(opinion_file, opinion_spec(config), config, log)
+    try:
+        opinion_headers = source.headers
+
+        required = [("HO_NO", opinion_headers), ("EMP_NO", lg_headers)]
+        if config.match_ssn:
+            required += [("jumin", opinion_headers), ("SSN", lg_headers)]
+        missing_cols = [name for name, headers in required if name not in headers]
+        if missing_cols:
+            log(f"오류: 다음 필수 열이 없어 소견을 매핑하지 않습니다: {', '.join(missing_cols)}")
+            return {}, []
+
+        opinion_mapping = [
+            (opinion_headers[col] - 1, lg_headers[config.opinion_columns[col]])
+            for col in config.opinion_columns
+            if col in opinion_headers and config.opinion_columns[col] in lg_headers
+        ]
+        if not opinion_mapping:
+            log("매핑할 열이 없습니다. opinion_columns의 키와 값이 두 파일에 존재하는지 확인하세요.")
+
+        ho_no_idx = opinion_headers["HO_NO"] - 1
+        jumin_idx = opinion_headers["jumin"] - 1 if config.match_ssn else None
+        opinion_index = {}
+        for row_no, row in enumerate(source.rows(), source.first_row_no):
+            ho_no = row[ho_no_idx] if ho_no_idx < len(row) else None
+            jumin = row[jumin_idx] if jumin_idx is not None and jumin_idx < len(row) else None
+            key = make_key(ho_no, jumin, config.match_ssn)
+            if key is None:
+                continue
+            values = tuple(row[src_idx] if src_idx < len(row) else None for src_idx, _ in opinion_mapping)
+            add_opinion(opinion_index, report.duplicate_opinion_keys, key, row_no, values)
+        return opinion_index, [lg_col for _, lg_col in opinion_mapping]
+    finally:
+        source.close()
+
+
+def write_records(ws_lg, records, styles, start_row):
+    """메모리상의 행(RecordStore)을 시트에 기록 (빈 값은 셀을 만들지 않음, 값이 있는 셀에는 열의 스타일을 지정)
+
+    서식이 있는 열 자체에는 apply_column_styles로 미리 같은 서식을 지정해 둔다 (빈 칸은 열 서식으로 보임).
+    """
+    for row_idx, values in enumerate(records, start=start_row):
+        for col_idx, value in enumerate(values, 1):
+            if value is not None:
+                cell = ws_lg.cell(row=row_idx, column=col_idx, value=value)
+                style = styles.get(col_idx)
+                if style is not None:
+                    apply_style(cell, style)
+
+
+def save_join_report(output_file, config, report, log):
+    """미매칭/중복 키가 있으면 전체 목록을 결과 파일 옆에 저장 (없으면 이전 리포트를 지움)"""
+    if not config.join_report:
+        return
+    path = join_report_path(output_file)
+    if report.unmatched_row_keys or report.unmatched_opinion_keys or report.duplicate_opinion_keys \
+            or report.duplicate_row_keys:
+        try:
+            write_join_report(path, report)
+            report.join_report_file = path
+        except OSError as e:
+            log(f"경고: 매칭 리포트를 저장하지 못했습니다: {path} ({e})")
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def checkpoint_path(output_file, stage_name):
+    """디버깅용 중간 저장 파일 이름 (예: LG결과_변환.1_병원결과.xlsx)"""
+    stem, dot, ext = output_file.rpartition(".")
+    return f"{stem}.{stage_name}.{ext}" if dot else f"{output_file}.{stage_name}"
+
+
+def save_workbook(wb, output_file, should_cancel=None):
+    """임시 파일에 저장한 뒤 교체하여 취소/오류 시 반쯤 쓰인 결과 파일이 남지 않도록 함"""
+    temp_file = f"{output_file}.tmp"
+    try:
+        wb.save(temp_file)
+        if should_cancel and should_cancel():
+            raise ConversionCancelled()
+        os.replace(temp_file, output_file)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def convert(hospital_file, opinion_file, template_file, output_file, config=None, *,
+            log=print, progress=None, should_cancel=None):
+    """병원결과와 병원소견을 LG결과 템플릿 형식으로 변환하여 output_file에 한 번만 저장하고 Report를 반환.
+
+    log(message), progress(done, total), should_cancel() 콜백은 모두 선택이며(progress의 total은 전체 행 수를
+    알 수 없으면 None),
+    log에 함수를 넘기면 config.verbose/trace_file에 맞춘 logs.LogSink로 감싼다 (LogSink를 넘기면 그대로 사용).
+    should_cancel이 참을 반환하면 ConversionCancelled를 발생시키고 결과 파일을 남기지 않는다.
+    입력 파일을 열 수 없거나 헤더 검사(config.schema_check)에서 필수 열이 없으면 ConversionError가 발생한다.
+    """
+    config = config or ConvertConfig()
+    report = Report(output_file)
+    fmt = output_format(output_file, config.output_format)
+    if fmt not in FLAT_FORMATS + ("xlsx",):
+        raise ConversionError(f"알 수 없는 출력 형식: {fmt} (xlsx, csv, parquet)")
+    if config.stream and config.keep_checkpoints:
+        # 스트리밍 모드는 행을 한 번만 흘려 쓰므로 소견을 채우기 전의 결과(1_병원결과)를 따로 저장할 수 없음
+        raise ConversionError("스트리밍 모드에서는 단계별 중간 결과 파일을 저장할 수 없습니다 "
+                              "(stream과 keep_checkpoints 중 하나만 사용)")
+    sink = log if isinstance(log, LogSink) else LogSink(log, DEBUG if config.verbose else INFO, config.trace_file)
+    try:
+        _convert(hospital_file, opinion_file, template_file, output_file, config, report, sink, progress,
+                 should_cancel, fmt)
+    finally:
+        sink.close()
+    if sink.trace_count and sink.trace_file:
+        report.trace_file = sink.trace_file
+    return report
+
+
+def _convert(hospital_file, opinion_file, template_file, output_file, config, report, log, progress, should_cancel,
+             fmt):
+    """헤더 검사 후 출력 형식/모드에 맞는 변환을 실행하고 report.elapsed를 기록"""
+    start = time.perf_counter()
+    with profile_to(config.profile_file, log):
+        if config.schema_check:
+            validate_schema(hospital_file, opinion_file, template_file, config, report, log)
+        if fmt in FLAT_FORMATS:
+            if config.incremental:
+                log("경고: 증분 변환은 xlsx 결과에만 지원되어 전체 변환합니다.")
+            _convert_flat(hospital_file, opinion_file, template_file, output_file, config, report,
+                          log, progress, should_cancel, fmt)
+        elif config.incremental:
+            from .incremental import convert_incremental
+            convert_incremental(hospital_file, opinion_file, template_file, output_file, config, report,
+                                log, progress, should_cancel)
+        elif config.stream:
+            _convert_stream(hospital_file, opinion_file, template_file, output_file, config, report,
+                            log, progress, should_cancel)
+        else:
+            _convert_in_memory(hospital_file, opinion_file, template_file, output_file, config, report,
+                               log, progress, should_cancel)
+    report.elapsed = time.perf_counter() - start
+
+
+def _convert_in_memory(hospital_file, opinion_file, template_file, output_file, config, report,
+                       log, progress, should_cancel, hospital=None, opinion=None, row_order=None):
+    """템플릿 서식을 그대로 유지하는 기본 모드: 모든 행을 메모리에서 합친 뒤 한 번만 저장.
+
+    hospital((헤더, 데이터 행, 첫 데이터 행 번호))과 opinion((소견 색인, 대상 열))을 이미 읽었으면 넘겨서 다시 읽지 않는다.
+    row_order(병원결과 데이터 행 위치 목록)를 주면 그 순서로 결과 행을 쓴다 (조인 리포트의 행 번호는 원본 기준).
+    """
+    with stage(report, "template") as stat:
+        wb_lg, ws_lg, lg_headers = load_template(template_file, config)
+        stat.rows = config.template_header_row
+    if config.keep_checkpoints:
+        wb_lg.save(checkpoint_path(output_file, "0_템플릿"))
+
+    if hospital is None:
+        with stage(report, "hospital") as stat:
+            hospital = load_hospital(hospital_file, config, log)
+            stat.rows = len(hospital[1])
+    hospital_headers, data_rows, first_row_no = hospital
+
+    with stage(report, "headers"):
+        plan = build_transform_plan(hospital_headers, lg_headers, config.column_map, config.numeric_columns,
+                                    config.right_align_columns)
+    log(f"변환 계획: {len(plan)}개 열")
+
+    transform = select_transform(config, log, report)
+    row_index = {}
+    with stage(report, "transform") as stat:
+        rows = track_rows(data_rows, len(data_rows), progress, should_cancel)
+        records = RecordStore(plan, lg_headers)
+        records.extend(index_rows(transform(rows, plan, lg_headers), lg_headers, config.match_ssn, row_index))
+        stat.rows = len(records)
+    # 이후로는 records만 사용하므로 병원결과 원본 행을 놓아 줌 (숫자 값은 records의 배열에 복사되어 있음)
+    del hospital, data_rows, rows
+    styles = column_styles(lg_headers, plan, config)
+    apply_column_styles(ws_lg, styles)
+    data_start_row = config.template_header_row + 1
+
+    def ordered():
+        return records if row_order is None else (records[position] for position in row_order)
+
+    if config.keep_checkpoints:
+        write_records(ws_lg, ordered(), styles, data_start_row)
+        wb_lg.save(checkpoint_path(output_file, "1_병원결과"))
+        log("중간 결과 파일이 저장되었습니다.")
+
+    if opinion is None:
+        with stage(report, "opinion") as stat:
+            opinion = load_opinion_index(opinion_file, lg_headers, config, report, log)
+            stat.rows = len(opinion[0])
+    opinion_index, opinion_lg_cols = opinion
+    with stage(report, "join") as stat:
+        join_indexed(records, row_index, opinion_index, opinion_lg_cols, report, first_row_no,
+                     trace_callback(log), lg_headers)
+        stat.rows = report.matched
+
+    with stage(report, "write") as stat:
+        write_records(ws_lg, ordered(), styles, data_start_row)
+        stat.rows = len(records)
+    with stage(report, "save"):
+        save_workbook(wb_lg, output_file, should_cancel)
+    save_join_report(output_file, config, report, log)
+
+
+def _convert_stream(hospital_file, opinion_file, template_file, output_file, config, report,
+                    log, progress, should_cancel):
+    """read-only 읽기 → 제너레이터 → write-only 쓰기. 소견 색인만 메모리에 두어 행 수와 무관하게 유지"""
+    wb_out = openpyxl.Workbook(write_only=True)
+    ws_out = wb_out.create_sheet()
+    with stage(report, "template") as stat:
+        lg_headers = copy_template_header(template_file, ws_out, config)
+        stat.rows = config.template_header_row
+
+    with stage(report, "opinion") as stat:
+        opinion_index, opinion_lg_cols = load_opinion_index(opinion_file, lg_headers, config, report, log)
+        stat.rows = len(opinion_index)
+
+    source = open_input(hospital_file, hospital_spec(config), config, log)
+    try:
+        hospital_headers = source.headers
+        with stage(report, "headers"):
+            plan = build_transform_plan(hospital_headers, lg_headers, config.column_map, config.numeric_columns,
+                                        config.right_align_columns)
+        log(f"변환 계획: {len(plan)}개 열")
+        styles = list(column_styles(lg_headers, plan, config).items())
+
+        transform = select_transform(config, log, report)
+        with stage(report, "stream") as stat:
+            rows = track_rows(source.rows(), source.total, progress, should_cancel)
+            rows = transform(rows, plan, lg_headers)
+            rows = iter_merged_rows(rows, lg_headers, opinion_index, opinion_lg_cols, config.match_ssn, report,
+                                    source.first_row_no, trace_callback(log))
+            for values in rows:
+                for lg_col, style in styles:
+                    cell = WriteOnlyCell(ws_out, value=values[lg_col - 1])
+                    apply_style(cell, style)
+                    values[lg_col - 1] = cell
+                ws_out.append(values)
+            stat.rows = report.rows
+    finally:
+        source.close()
+
+    with stage(report, "save"):
+        save_workbook(wb_out, output_file, should_cancel)
+    save_join_report(output_file, config, report, log)
+
+
+def _convert_flat(hospital_file, opinion_file, template_file, output_file, config, report,
+                  log, progress, should_cancel, fmt):
+    """템플릿 서식 없이 헤더 순서대로 CSV/Parquet에 행을 바로 쓰는 대용량 전송용 모드"""
+    with stage(report, "template") as stat:
+        lg_headers = read_template_headers(template_file, config.template_header_row, config.template_cache)
+        stat.rows = 1
+    columns = sorted(lg_headers.items(), key=lambda item: item[1])
+
+    with stage(report, "opinion") as stat:
+        opinion_index, opinion_lg_cols = load_opinion_index(opinion_file, lg_headers, config, report, log)
+        stat.rows = len(opinion_index)
+
+    try:
+        writer = open_flat_writer(fmt, output_file, [name for name, _ in columns])
+    except ImportError as e:
+        raise ConversionError(str(e)) from None
+    source = None
+    completed = False
+    try:
+        source = open_input(hospital_file, hospital_spec(config), config, log)
+        hospital_headers = source.headers
+        with stage(report, "headers"):
+            plan = build_transform_plan(hospital_headers, lg_headers, config.column_map, config.numeric_columns,
+                                        config.right_align_columns)
+        log(f"변환 계획: {len(plan)}개 열")
+        indexes = [col_idx - 1 for _, col_idx in columns]
+
+        transform = select_transform(config, log, report)
+        with stage(report, "stream") as stat:
+            rows = track_rows(source.rows(), source.total, progress, should_cancel)
+            rows = transform(rows, plan, lg_headers)
+            rows = iter_merged_rows(rows, lg_headers, opinion_index, opinion_lg_cols, config.match_ssn, report,
+                                    source.first_row_no, trace_callback(log))
+            for values in rows:
+                writer.write([values[idx] for idx in indexes])
+            stat.rows = report.rows
+
+        if should_cancel and should_cancel():
+            raise ConversionCancelled()
+        with stage(report, "save"):
+            writer.close()
+        completed = True
+    finally:
+        if source is not None:
+            source.close()
+        if not completed:
+            writer.abort()
+    save_join_report(output_file, config, report, log)
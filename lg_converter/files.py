@@ -0,0 +1,43 @@
+"""파일 내용 해시와 상태(크기, 수정 시각), 임시 파일을 거친 교체, 사용자 캐시 폴더: 증분 변환 상태와 캐시가 함께 씀"""
+import hashlib
+import os
+import tempfile
+
+
+def file_digest(path):
+    """파일 내용의 sha256 (16진수). 1MB씩 읽음"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_stamp(path):
+    """(크기, 수정 시각 ns)"""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def user_cache_dir(name):
+    """사용자 캐시 폴더 아래 lg_converter/name (Windows: %LOCALAPPDATA%, 그 밖: $XDG_CACHE_HOME 또는 ~/.cache)"""
+    base = os.environ.get("LOCALAPPDATA") if os.name == "nt" else os.environ.get("XDG_CACHE_HOME")
+    return os.path.join(base or os.path.join(os.path.expanduser("~"), ".cache"), "lg_converter", name)
+
+
+def replace_file(path, write):
+    """path와 같은 폴더에 고유한 이름의 임시 파일을 만들어 write(임시 파일 경로)로 쓴 뒤 path로 교체
+
+    여러 프로세스가 같은 파일을 동시에 써도 서로의 임시 파일을 덮어쓰지 않는다. 실패하면 임시 파일을 지우고 예외를 그대로 올린다.
+    """
+    fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(temp_file)
+        os.replace(temp_file, path)
+    except BaseException:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        raise
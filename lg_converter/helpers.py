@@ -0,0 +1,47 @@
+"""병원결과 값 → LG결과 값 변환 함수"""
+
+
+def convert_emp_no(value):
+    """EMP_NO가 숫자형이면 숫자로, 문자형이면 그대로 반환"""
+    try:
+        return int(value) if isinstance(value, (int, float)) and value == int(value) else str(value)
+    except ValueError:
+        return str(value)
+
+def convert_to_numeric(value):
+    """숫자형 데이터 변환 (변환 가능하면 float, 불가능하면 그대로)"""
+    try:
+        return float(value) if value not in (None, "", " ") else None
+    except ValueError:
+        return value
+
+def truncate_ssn(value):
+    """주민등록번호(SSN) 왼쪽 8자리만 출력"""
+    return str(value)[:8] if isinstance(value, str) else value
+
+def convert_mdc_date(value):
+    """MDC_DATE에서 '-' 제거 후 숫자로 변환"""
+    if isinstance(value, str):
+        cleaned_value = value.replace("-", "")
+        try:
+            return int(cleaned_value)
+        except ValueError:
+            return cleaned_value
+    return value
+
+def extract_sex_no(ssn_value):
+    """SSN 값에서 왼쪽에서 8번째 문자를 추출하여 sex_no 변수에 저장"""
+    if isinstance(ssn_value, str) and len(ssn_value) >= 8:
+        sex_digit = ssn_value[7]
+        if sex_digit in {"1", "3", "5"}:
+            return 22
+        elif sex_digit in {"2", "4", "6"}:
+            return 21
+    return None
+
+def calculate_bm06(bm01_value, sex_no):
+    """BM06 값을 계산"""
+    try:
+        return round((float(bm01_value) / 100) * (float(bm01_value) / 100) * sex_no, 1)
+    except (ValueError, TypeError, ZeroDivisionError):
+        return None
@@ -0,0 +1,176 @@
+"""병원소견 매칭(조인): 정규화한 키, 색인 조인, 미매칭/중복 리포트
+
+매칭 키는 문자열을 이어 붙이는 대신 (사번, 주민번호) 튜플이며, 각 값은 비교 전에 정규화한다.
+- 사번: 정수 값이면 int/float/숫자 문자열 모두 같은 키 (100001, 100001.0, "100001" → "100001")
+- 주민번호: 앞뒤 공백 제거
+같은 키가 병원소견에 여러 번 나오면 기존과 같이 마지막 행의 소견을 사용하고 중복으로 기록한다.
+"""
+import csv
+import os
+
+REPORT_HEADER = ["구분", "파일", "행", "사번", "주민번호", "비고"]
+
+
+def normalize_emp_no(value):
+    """사번을 비교용 문자열로 정규화 (빈 값은 None)"""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    text = str(value).strip()
+    if text.isascii() and text.isdigit():
+        return str(int(text))
+    return text or None
+
+
+def normalize_ssn(value):
+    """주민번호를 비교용 문자열로 정규화 (빈 값은 None)"""
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def make_key(emp_no, ssn, match_ssn):
+    """정규화한 (사번, 주민번호) 매칭 키. match_ssn이 거짓이면 주민번호는 비교하지 않음. 키 값이 비어 있으면 None"""
+    emp_no = normalize_emp_no(emp_no)
+    if emp_no is None:
+        return None
+    if not match_ssn:
+        return (emp_no,)
+    ssn = normalize_ssn(ssn)
+    return (emp_no, ssn) if ssn is not None else None
+
+
+def format_key(key):
+    return "|".join(key) if key else "(키 없음)"
+
+
+def add_opinion(opinion_index, duplicates, key, row_no, values):
+    """소견 색인에 한 행 추가. 중복 키는 마지막 행으로 덮어쓰고 duplicates에 행 번호를 모음"""
+    previous = opinion_index.get(key)
+    if previous is not None:
+        duplicates.setdefault(key, [previous[0]]).append(row_no)
+    opinion_index[key] = (row_no, values)
+
+
+def key_columns(lg_headers):
+    """LG결과 행에서 매칭 키를 만들 EMP_NO, SSN 열 인덱스 (0부터, 없으면 None)"""
+    emp_no_idx = lg_headers["EMP_NO"] - 1 if "EMP_NO" in lg_headers else None
+    ssn_idx = lg_headers["SSN"] - 1 if "SSN" in lg_headers else None
+    return emp_no_idx, ssn_idx
+
+
+def row_key(values, emp_no_idx, ssn_idx, match_ssn):
+    if emp_no_idx is None:
+        return None
+    return make_key(values[emp_no_idx], values[ssn_idx] if ssn_idx is not None else None, match_ssn)
+
+
+def index_rows(rows, lg_headers, match_ssn, row_index):
+    """변환된 행을 그대로 내보내면서 매칭 키 → 행 위치 목록 색인을 채움 (결과 전달 단계에서 함께 수행)"""
+    emp_no_idx, ssn_idx = key_columns(lg_headers)
+    for position, values in enumerate(rows):
+        row_index.setdefault(row_key(values, emp_no_idx, ssn_idx, match_ssn), []).append(position)
+        yield values
+
+
+def fill_opinion(values, opinion_values, opinion_lg_cols):
+    for lg_col, value in zip(opinion_lg_cols, opinion_values):
+        values[lg_col - 1] = value
+
+
+def join_indexed(records, row_index, opinion_index, opinion_lg_cols, report, first_row_no, log=None,
+                 lg_headers=None):
+    """결과 색인과 소견 색인을 키로 조인하여 records(RecordStore)에 소견 값을 채우고 report에 매칭/미매칭/중복을 기록"""
+    lg_header_names = {col_idx: name for name, col_idx in (lg_headers or {}).items()}
+    matched_positions = []
+    for key, positions in row_index.items():
+        if key is None:
+            continue
+        if len(positions) > 1:
+            report.duplicate_row_keys[key] = [first_row_no + position for position in positions]
+        opinion = opinion_index.get(key)
+        if opinion is None:
+            continue
+        for position in positions:
+            records.fill_opinion(position, opinion[1], opinion_lg_cols)
+            matched_positions.append(position)
+            if log:
+                log(f"[{position + 1}행] {format_key(key)}: " + ", ".join(
+                    f"{lg_header_names.get(lg_col, lg_col)}={value}"
+                    for lg_col, value in zip(opinion_lg_cols, opinion[1])))
+
+    report.rows = len(records)
+    report.matched = len(matched_positions)
+    matched = set(matched_positions)
+    keys_by_position = {position: key for key, positions in row_index.items() for position in positions}
+    report.unmatched_row_keys = [(first_row_no + position, keys_by_position.get(position))
+                                 for position in range(len(records)) if position not in matched]
+    finish_opinion(report, opinion_index, row_index)
+
+
+def iter_merged_rows(rows, lg_headers, opinion_index, opinion_lg_cols, match_ssn, report, first_row_no, log=None):
+    """스트리밍용: 변환된 행마다 소견 색인을 찾아 값을 채워 내보내고 report에 매칭/미매칭/중복을 기록"""
+    emp_no_idx, ssn_idx = key_columns(lg_headers)
+    lg_header_names = {col_idx: name for name, col_idx in lg_headers.items()}
+    seen = {}
+    for position, values in enumerate(rows):
+        row_no = first_row_no + position
+        report.rows += 1
+        key = row_key(values, emp_no_idx, ssn_idx, match_ssn)
+        if key is not None:
+            if key in seen:
+                report.duplicate_row_keys.setdefault(key, [seen[key]]).append(row_no)
+            else:
+                seen[key] = row_no
+        opinion = opinion_index.get(key) if key is not None else None
+
+        if opinion is None:
+            report.unmatched_row_keys.append((row_no, key))
+        else:
+            report.matched += 1
+            fill_opinion(values, opinion[1], opinion_lg_cols)
+            if log:
+                log(f"[{report.rows}행] {format_key(key)}: " + ", ".join(
+                    f"{lg_header_names[lg_col]}={value}" for lg_col, value in zip(opinion_lg_cols, opinion[1])))
+        yield values
+
+    finish_opinion(report, opinion_index, seen)
+
+
+def finish_opinion(report, opinion_index, row_keys):
+    """결과 쪽 키 집합과 비교하여 소견 건수와 미매칭 소견을 report에 기록"""
+    report.opinion = len(opinion_index)
+    report.unmatched_opinion_keys = sorted(
+        (row_no, key) for key, (row_no, _) in opinion_index.items() if key not in row_keys)
+    report.unmatched_opinion = len(report.unmatched_opinion_keys)
+
+
+def join_report_path(output_file):
+    """미매칭/중복 리포트 파일 이름 (예: LG결과_변환.매칭.csv)"""
+    return f"{os.path.splitext(output_file)[0]}.매칭.csv"
+
+
+def write_join_report(path, report, hospital_label="병원결과", opinion_label="병원소견"):
+    """미매칭/중복 키 전체를 엑셀에서 바로 열 수 있는 CSV(UTF-8 BOM)로 저장"""
+    def split(key):
+        key = key or ()
+        return (key[0] if len(key) > 0 else "", key[1] if len(key) > 1 else "")
+
+    temp_file = f"{path}.tmp"
+    with open(temp_file, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(REPORT_HEADER)
+        for row_no, key in report.unmatched_row_keys:
+            writer.writerow(["결과 미매칭", hospital_label, row_no, *split(key), "" if key else "매칭 키 없음"])
+        for row_no, key in report.unmatched_opinion_keys:
+            writer.writerow(["소견 미매칭", opinion_label, row_no, *split(key), ""])
+        for key, row_nos in report.duplicate_opinion_keys.items():
+            for row_no in row_nos:
+                note = "사용" if row_no == row_nos[-1] else "무시 (같은 키의 마지막 행 사용)"
+                writer.writerow(["소견 중복", opinion_label, row_no, *split(key), note])
+        for key, row_nos in report.duplicate_row_keys.items():
+            for row_no in row_nos:
+                writer.writerow(["결과 중복", hospital_label, row_no, *split(key), "같은 키의 결과 행이 여러 개"])
+    os.replace(temp_file, path)
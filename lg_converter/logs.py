@@ -0,0 +1,74 @@
+"""변환 로그: 수준별 출력, 최근 항목 링 버퍼, 행 단위 상세 로그(trace)의 지연 파일 저장
+
+convert(log=...)에는 print 같은 함수나 LogSink를 넘길 수 있으며, 함수를 넘기면 convert()가 LogSink로 감싼다.
+행 단위 상세 로그는 LogSink.tracing이 참일 때만(디버그 수준이거나 trace_file 지정) 만들어지므로
+평소에는 행마다 문자열을 만드는 비용이 없다.
+"""
+import time
+from collections import deque
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+BUFFER_SIZE = 1000  # 링 버퍼에 남길 최근 로그 항목 수
+
+
+def message_level(message):
+    """기존 메시지 규칙("오류: ...", "경고: ...")으로 수준을 정함"""
+    if message.startswith(("오류", "에러")):
+        return ERROR
+    if message.startswith("경고"):
+        return WARNING
+    return INFO
+
+
+class LogSink:
+    """emit(message)으로 level 이상만 내보내고, 모든 항목은 최근 buffer_size개까지 entries에 (시각, 수준, 메시지)로 보관.
+
+    trace()로 남기는 행 단위 상세 로그는 trace_file이 있으면 첫 항목이 나올 때 파일을 열어 그곳에만 쓰고,
+    없으면 level이 DEBUG일 때만 emit으로 내보낸다.
+    """
+
+    def __init__(self, emit=print, level=INFO, trace_file=None, buffer_size=BUFFER_SIZE):
+        self.emit = emit
+        self.level = level
+        self.trace_file = trace_file
+        self.entries = deque(maxlen=buffer_size)
+        self.trace_count = 0
+        self._trace = None
+
+    @property
+    def tracing(self):
+        return self.level <= DEBUG or self.trace_file is not None
+
+    def __call__(self, message, level=None):
+        level = level or message_level(message)
+        self.entries.append((time.time(), level, message))
+        if level >= self.level:
+            self.emit(message)
+
+    def trace(self, message):
+        self.trace_count += 1
+        self.entries.append((time.time(), DEBUG, message))
+        if self.trace_file is not None:
+            if self._trace is None:
+                self._trace = open(self.trace_file, "w", encoding="utf-8")
+            self._trace.write(message)
+            self._trace.write("\n")
+        elif self.level <= DEBUG:
+            self.emit(message)
+
+    def tail(self, count=None, level=DEBUG):
+        """링 버퍼의 최근 메시지 (level 이상, count개까지)"""
+        messages = [f"[{LEVEL_NAMES.get(entry_level, entry_level)}] {message}"
+                    for _, entry_level, message in self.entries if entry_level >= level]
+        return messages[-count:] if count else messages
+
+    def close(self):
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+
+
+def trace_callback(log):
+    """행 단위 상세 로그 콜백 (상세 로그를 남기지 않으면 None이라 호출하는 쪽에서 문자열을 만들지 않음)"""
+    return log.trace if isinstance(log, LogSink) and log.tracing else None
@@ -0,0 +1,54 @@
+"""기본 열 매핑 설정 (병원결과/병원소견 헤더 → LG결과 헤더)"""
+
+RIGHT_ALIGN_COLUMNS = {"CE01", "CE02", "CE03"}
+NUMERIC_COLUMNS = {
+    "MDC_DATE", "BM01", "BM02", "BM04", "BM05", "BM07", "CV02", "CV01", "CV03",
+    "OE101", "OE102", "OE103", "OE104", "OE301", "OE302", "AM103", "AM104", "AM105",
+    "AM106", "AM107", "AM108", "AM121", "AM122", "AM111", "AM112", "AM115", "AM116",
+    "CB101", "CB110", "CB112", "CB113", "CB104", "CB105", "CB106", "CB107", "CB108",
+    "CB109", "CB203", "CB204", "CB205", "CB206", "DM04", "DM07", "LP01", "LP02",
+    "LP03", "LP04", "LF13", "LF14", "LF15", "LF04", "LF05", "LF06", "LF11", "LF10",
+    "LF16", "LF19", "RF03", "RF02", "RF04", "EL01", "EL02", "EL03", "EL04", "TF06",
+    "TF03", "VE301", "SY03", "CE01", "CE02", "CE03", "CE04", "CE05", "CE06", "GT01",
+    "RA01", "RA02", "RA03", "UA101", "UA102", "CB102", "CB111", "CB201", "LF03",
+    "LF12", "LF08", "LF17", "BM06"
+}
+# "L5237"은 예전에 "GI203"과 "G1203" 두 번 적혀 있었고 뒤의 "G1203"이 적용되고 있었으므로 그 값만 남김
+COLUMN_MAP = {
+    "사원번호": "EMP_NO", "주민등록번호": "SSN", "진료일자": "MDC_DATE", "HA001": "BM01",
+    "HA002": "BM02", "HA004": "BM04", "FAT": "BM05", "HA007": "BM07", "L90001": "BT01",
+    "L70013": "BT02", "HB001": "CV02", "HB002": "CV01", "A8001": "CV03", "E6541": "CV04",
+    "HO001": "OE101", "HO002": "OE102", "HO003": "OE103", "HO004": "OE104", "HO011": "OE205",
+    "HO005": "OE301", "HO006": "OE302", "OHA01": "AM103", "OHA09": "AM104", "OHA02": "AM105",
+    "OHA10": "AM106", "OHA03": "AM107", "OHA11": "AM108", "OHA04": "AM121", "OHA12": "AM122",
+    "OHA05": "AM111", "OHA13": "AM112", "OHA06": "AM115", "OHA14": "AM116", "L2012": "CB101",
+    "L2014": "CB110", "L07003501": "CB112", "L20220": "CB113", "L20141": "CB104", "L20142": "CB105",
+    "L20143": "CB106", "L2015": "CB107", "L2016": "CB108", "L2011": "CB109", "L20191": "CB203",
+    "L20193": "CB204", "L20192": "CB205", "L20194": "CB206", "L3012": "DM04", "L3231": "DM07",
+    "L3015": "LP01", "L3081": "LP02", "L3082": "LP03", "L3083": "LP04", "L3016": "LF13",
+    "LAC10401": "LF14", "A009": "LF15", "L3018": "LF03", "L3019": "LF04", "L3033": "LF05",
+    "L3020": "LF06", "L3062": "LF11", "LAC10402": "LF10", "L3051": "LF16", "LAC114": "LF17",
+    "LAC158": "LF19", "N20501": "VE105", "N20502": "VE102", "N20511": "VE201", "L170360": "VE106",
+    "L170380": "VE107", "L3032": "RF03", "L3013": "RF02", "LAC104031": "RF04", "LAC13701": "EL01",
+    "L3031": "EL02", "L3041": "EL03", "L3042": "EL04", "RU103": "TF01", "N20006": "TF06",
+    "N20003": "TF03", "LIS11001": "VE301", "L3092": "SY03", "L51821": "CE01", "L51811": "CE02",
+    "N206101": "CE03", "N20609": "CE04", "N206151": "CE05", "L150026": "CE06", "L3014": "GT01",
+    "L5114": "RA03", "L6103": "UA101", "L6102": "UA102", "L6110": "UA103", "L6104": "UA106",
+    "L6107": "UA108", "L6108": "UA301", "L6109": "UA302", "L6105": "UA401", "L61132": "UA201",
+    "L61131": "UA202", "L61133": "UA203", "TK531": "SE02", "TK02": "SE01", "TK03": "SE03",
+    "RZ901A2": "BD01", "RP201": "RE101", "L9742HPC": "RE200", "RC4011": "GI303", "S1005": "GI201",
+    "C5602": "GI205", "RU401": "US02", "S2322": "US03", "RU902A": "US04",
+    "RU505": "US05", "S1008B": "US07", "CTN710": "US08", "N456232": "US09", "RC101": "US10",
+    "C5601": "US13", "RP20BBA": "GY03", "RU201": "GY04", "P30001": "GY05", "RC94HL": "RE402",
+    "L2013": "CB102", "L3021": "LF12", "L1820": "LF08", "LAC162": "RA01", "TH01": "RA02",
+    "L20221": "CB111", "L20190": "CB201", "RC94HC": "RE403", "L6106": "UA402", "L5237": "G1203",
+    "RN801": "US15", "N456000": "US16", "N455004": "US17", "CTN711H": "US20", "SE60": "US11",
+    "TX0B300": "GY07"
+}
+OPINION_COLUMNS = {
+    "A1": "MDC_DECI", "A2": "STATE", "A3": "RECIPE1", "A4": "RECIPE2", "A5": "RECIPE3",
+    "A6": "RECIPE4", "A7": "RECIPE5", "A8": "MDC_GRADE1", "A9": "OPIN_CODE1", "A10": "OPIN_DESCRIPT1",
+    "A11": "MDC_GRADE2", "A12": "OPIN_CODE2", "A13": "OPIN_DESCRIPT2", "A14": "MDC_GRADE3",
+    "A15": "OPIN_CODE3", "A16": "OPIN_DESCRIPT3", "A17": "MDC_GRADE4", "A18": "OPIN_CODE4",
+    "A19": "OPIN_DESCRIPT4", "A20": "MDC_GRADE5", "A21": "OPIN_CODE5", "A22": "OPIN_DESCRIPT5"
+}
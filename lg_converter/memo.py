@@ -0,0 +1,85 @@
+"""열별 변환 결과 캐시: 같은 문자열이 반복되는 변환 열(숫자 변환하는 UA1xx 소변 검사 등)은 값마다 한 번만 변환
+
+- 변환 함수가 있는 열만 캐시한다. UA2xx, US*, GY*, GI* 같은 문자열 열과 소견의 OPIN_CODE*/MDC_GRADE*는
+  변환 없이 값을 그대로 복사하므로 캐시할 것이 없고, 캐시를 씌우면 조회 비용만큼 느려진다(bench_memo의 열 종류별 시간).
+- 열마다 크기가 제한된 LRU 캐시(functools.lru_cache)를 두고, 입력이 문자열인 값만 캐시한다.
+  숫자와 빈 값은 변환 함수가 캐시 조회보다 빠르므로 그대로 변환한다.
+- 사원마다 값이 다른 EMP_NO/SSN 열은 캐시하지 않는다.
+- CHECK_INTERVAL행마다 적중률을 확인하여 적중보다 미스가 많은 열(값 종류가 많은 열)은 캐시를 끈다.
+"""
+from functools import lru_cache
+
+DEFAULT_SIZE = 1024  # 열마다 캐시할 값 수
+CHECK_INTERVAL = 1024  # 적중률을 확인하는 행 간격
+UNIQUE_COLUMNS = {"EMP_NO", "SSN"}
+
+
+def chain(converters):
+    """변환 함수 목록을 차례로 적용하는 함수 하나"""
+    if len(converters) == 1:
+        return converters[0]
+
+    def convert_all(value):
+        for convert in converters:
+            value = convert(value)
+        return value
+    return convert_all
+
+
+class ConverterMemo:
+    """변환 한 번 동안의 열별 캐시와 적중/미스 통계"""
+
+    def __init__(self, maxsize=DEFAULT_SIZE):
+        self.maxsize = maxsize
+        self.caches = {}  # LG결과 열 이름 → lru_cache로 감싼 변환 함수
+        self.disabled = set()  # 적중률이 낮아 캐시를 끈 열 이름
+
+    def steps(self, plan, lg_headers):
+        """변환 계획 항목마다 (병원결과 열 인덱스, LG결과 열 번호, 변환 함수 목록, 캐시 함수 또는 None)
+
+        변환 함수가 없는 열(값을 그대로 복사)과 EMP_NO/SSN 열의 캐시 함수는 None
+        """
+        names = {col_idx: name for name, col_idx in lg_headers.items()}
+        steps = []
+        for src_idx, lg_col, converters, _ in plan:
+            name = names.get(lg_col, lg_col)
+            cached = None
+            if converters and name not in UNIQUE_COLUMNS:
+                cached = self.caches[name] = lru_cache(self.maxsize, typed=True)(chain(converters))
+            steps.append((src_idx, lg_col, converters, cached))
+        return steps
+
+    def prune(self, steps):
+        """미스가 적중보다 많은 열은 캐시를 끄고 변환 함수를 바로 호출하도록 steps를 바꿈"""
+        names = {cached: name for name, cached in self.caches.items()}
+        for position, (src_idx, lg_col, converters, cached) in enumerate(steps):
+            if cached is not None:
+                info = cached.cache_info()
+                if info.hits < info.misses:
+                    steps[position] = (src_idx, lg_col, converters, None)
+                    self.disabled.add(names[cached])
+
+    def stats(self):
+        """열 이름 → (적중, 미스, 캐시된 값 수)"""
+        stats = {}
+        for name, cached in self.caches.items():
+            info = cached.cache_info()
+            stats[name] = (info.hits, info.misses, info.currsize)
+        return stats
+
+    def totals(self):
+        hits = misses = 0
+        for cached in self.caches.values():
+            info = cached.cache_info()
+            hits += info.hits
+            misses += info.misses
+        return hits, misses
+
+    def summary_line(self):
+        hits, misses = self.totals()
+        lookups = hits + misses
+        rate = hits / lookups * 100 if lookups else 0.0
+        line = f"변환 캐시: 적중 {hits:,}, 미스 {misses:,} (적중률 {rate:.1f}%, 캐시 열 {len(self.caches)}개"
+        if self.disabled:
+            line += f", 적중률이 낮아 끈 열 {len(self.disabled)}개"
+        return line + ")"
@@ -0,0 +1,46 @@
+"""병원결과 행 변환을 프로세스 풀에서 묶음 단위로 병렬 실행
+
+행을 chunk_size개씩 묶어 작업 프로세스로 보내고, 결과는 원래 행 순서대로 내보낸다.
+한 번에 작업 중인 묶음은 작업 프로세스 수의 두 배까지만 두어 메모리가 행 수에 비례해 늘지 않는다.
+묶음 하나로 끝나는 작은 파일은 프로세스를 띄우지 않고 현재 프로세스에서 변환한다.
+결과는 직렬 변환(plan.iter_transformed_rows)과 같다.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .plan import iter_transformed_rows as iter_scalar_rows
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def transform_chunk(rows, plan, lg_headers):
+    """작업 프로세스에서 실행: 묶음 하나를 변환한 행 목록"""
+    return list(iter_scalar_rows(rows, plan, lg_headers))
+
+
+def iter_transformed_rows(data_rows, plan, lg_headers, workers, chunk_size):
+    data_rows = iter(data_rows)
+    first = list(islice(data_rows, chunk_size))
+    if len(first) < chunk_size:
+        yield from transform_chunk(first, plan, lg_headers)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+
+    def submit(chunk):
+        if chunk:
+            pending.append(executor.submit(transform_chunk, chunk, plan, lg_headers))
+
+    try:
+        submit(first)
+        for _ in range(workers * 2 - 1):
+            submit(list(islice(data_rows, chunk_size)))
+        while pending:
+            rows = pending.popleft().result()
+            submit(list(islice(data_rows, chunk_size)))
+            yield from rows
+    finally:
+        # 취소/오류 시 아직 시작하지 않은 묶음은 버림
+        executor.shutdown(wait=True, cancel_futures=True)
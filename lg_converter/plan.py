@@ -0,0 +1,77 @@
+"""변환 계획: column_map을 실행 전에 한 번만 해석하고 행 반복문은 계획만 실행"""
+from .helpers import (calculate_bm06, convert_emp_no, convert_mdc_date, convert_to_numeric, extract_sex_no,
+                      truncate_ssn)
+from .memo import CHECK_INTERVAL
+
+
+def build_transform_plan(hospital_headers, lg_headers, column_map, numeric_columns, right_align_columns):
+    """column_map을 실행 전에 한 번만 해석하여 변환 계획을 만든다.
+
+    각 항목은 (병원결과 열 인덱스(0부터), LG결과 열 번호(1부터), 변환 함수 목록, 오른쪽 정렬 여부)이며,
+    행 반복문에서는 헤더 역참조 없이 이 목록만 실행한다.
+    """
+    plan = []
+    for header, lg_column_name in column_map.items():
+        if header not in hospital_headers or lg_column_name not in lg_headers:
+            continue
+
+        converters = []
+        if lg_column_name == "EMP_NO":
+            converters.append(convert_emp_no)
+        if lg_column_name in numeric_columns:
+            converters.append(convert_to_numeric)
+        if lg_column_name == "SSN":
+            converters.append(truncate_ssn)
+        if lg_column_name == "MDC_DATE":
+            converters.append(convert_mdc_date)
+
+        plan.append((
+            hospital_headers[header] - 1,
+            lg_headers[lg_column_name],
+            tuple(converters),
+            lg_column_name in right_align_columns,
+        ))
+    return plan
+
+
+def iter_transformed_rows(data_rows, plan, lg_headers, memo=None):
+    """병원결과 행을 변환 계획에 따라 LG결과 행(값 리스트)으로 하나씩 변환.
+
+    memo(memo.ConverterMemo)를 넘기면 문자열 값의 변환 결과를 열별 캐시에서 재사용한다.
+    """
+    ssn_col_idx = lg_headers.get("SSN")
+    bm01_col_idx = lg_headers.get("BM01")
+    bm06_col_idx = lg_headers.get("BM06")
+    width = max(lg_headers.values(), default=0)
+    min_source_width = max((src_idx for src_idx, _, _, _ in plan), default=-1) + 1
+    if memo is not None:
+        steps = memo.steps(plan, lg_headers)
+    else:
+        steps = [(src_idx, lg_col, converters, None) for src_idx, lg_col, converters, _ in plan]
+
+    for row_no, row in enumerate(data_rows, 1):
+        if memo is not None and row_no % CHECK_INTERVAL == 0:
+            memo.prune(steps)
+        if len(row) < min_source_width:
+            row = tuple(row) + (None,) * (min_source_width - len(row))
+
+        values = [None] * width
+        sex_no = None
+        bm01_value = None
+        for src_idx, lg_col, converters, cached in steps:
+            value = row[src_idx]
+            if cached is not None and type(value) is str:
+                value = cached(value)
+            else:
+                for convert in converters:
+                    value = convert(value)
+
+            if lg_col == ssn_col_idx:
+                sex_no = extract_sex_no(value)
+            if lg_col == bm01_col_idx:
+                bm01_value = value
+            values[lg_col - 1] = value
+
+        if bm06_col_idx and bm01_value and sex_no:
+            values[bm06_col_idx - 1] = calculate_bm06(bm01_value, sex_no)
+        yield values
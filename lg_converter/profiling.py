@@ -0,0 +1,84 @@
+"""변환 단계별 시간/행 수/메모리 계측과 cProfile 저장"""
+import cProfile
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# 보고서에 표시할 단계 이름
+STAGE_LABELS = {
+    "schema": "헤더 검사",
+    "template": "템플릿 로드",
+    "hospital": "병원결과 로드",
+    "headers": "헤더 해석",
+    "transform": "행 변환",
+    "opinion": "병원소견 로드",
+    "join": "소견 매칭",
+    "diff": "변경 비교",
+    "stream": "변환+매칭+쓰기",
+    "write": "셀 쓰기",
+    "save": "저장",
+}
+MEMORY_UNAVAILABLE = "  메모리: 측정 불가 (psutil이 설치되지 않음, pip install psutil)"
+
+
+def rss_mb():
+    """현재 프로세스의 RSS(MB). psutil이 없으면 /proc(리눅스)에서 읽고, 그것도 없으면(윈도우 등) None"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+@dataclass
+class StageStat:
+    """단계 하나의 누적 측정값"""
+
+    seconds: float = 0.0
+    rows: int = None
+    memory_mb: float = None  # 단계 전후 RSS 차이
+
+    def line(self, name):
+        label = STAGE_LABELS.get(name, name)
+        rows = f"{self.rows:>8,}행" if self.rows is not None else " " * 9
+        memory = f"{self.memory_mb:+9.1f}MB" if self.memory_mb is not None else ""
+        return f"  {label:<10} {self.seconds:>8.3f}초 {rows} {memory}".rstrip()
+
+
+@contextmanager
+def stage(report, name):
+    """단계별 소요 시간과 메모리 변화를 report.stages에 누적. 행 수는 반환된 StageStat.rows에 기록"""
+    stat = report.stages.setdefault(name, StageStat())
+    before = rss_mb()
+    start = time.perf_counter()
+    try:
+        yield stat
+    finally:
+        stat.seconds += time.perf_counter() - start
+        after = rss_mb()
+        if before is not None and after is not None:
+            stat.memory_mb = (stat.memory_mb or 0.0) + after - before
+
+
+@contextmanager
+def profile_to(path, log=print):
+    """path가 있으면 블록 실행을 cProfile로 측정하여 pstats 파일로 저장 (python -m pstats path로 확인)"""
+    if not path:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        log(f"프로파일 저장: {path}")
@@ -0,0 +1,228 @@
+"""병원결과/병원소견 시트 읽기 백엔드
+
+- openpyxl: read-only 모드 (기본값, 기본 설치만으로 동작)
+- calamine: python-calamine(Rust로 구현된 xlsx 파서). XML 파싱이 훨씬 빠르지만 아래 차이가 있어 직접 골라야 사용
+
+두 백엔드 모두 시트의 1행부터 값 튜플을 하나씩 내보내며, calamine 값은 openpyxl과 같아지도록 맞춘다.
+- 빈 칸은 None ("" 아님)
+- 정수 값의 실수(7.0)는 int (openpyxl은 소수점 없이 저장된 숫자를 int로 읽음)
+- 날짜만 있는 값은 자정의 datetime
+알려진 차이: calamine은 다음 칸을 빈 칸(None)으로 읽어 결과가 openpyxl과 달라질 수 있다.
+- xml:space 없이 저장된 공백만 있는 문자열(" "). openpyxl로 만든 병원결과에는 이런 칸이 흔하다.
+- 오류 값(#N/A, #DIV/0! 등). openpyxl은 오류 문자열 그대로 읽는다.
+calamine은 빈 칸과 이런 칸을 구별해 돌려주지 않으므로 값을 되살릴 수 없다.
+"""
+import datetime
+import zipfile
+from xml.etree import ElementTree
+
+import openpyxl
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+BACKENDS = ("auto", "openpyxl", "calamine")
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+INT_LIMIT = 1e15  # 이보다 큰 수는 엑셀이 지수 표기로 저장하여 openpyxl도 float로 읽음
+
+
+def calamine_available():
+    return CalamineWorkbook is not None
+
+
+class OpenpyxlSheet:
+    """openpyxl read-only 워크북의 시트 (sheet: 시트 이름, None이면 활성 시트)"""
+
+    backend = "openpyxl"
+
+    def __init__(self, path, sheet=None):
+        self._wb = openpyxl.load_workbook(path, read_only=True)
+        self._ws = self._wb.active if sheet is None else self._wb[sheet]
+
+    @property
+    def max_row(self):
+        return self._ws.max_row
+
+    def iter_rows(self):
+        return self._ws.iter_rows(values_only=True)
+
+    def close(self):
+        self._wb.close()
+
+
+def _calamine_value(value):
+    if value == "":
+        return None
+    if type(value) is float and value.is_integer() and -INT_LIMIT < value < INT_LIMIT:
+        return int(value)
+    if type(value) is datetime.date:
+        return datetime.datetime(value.year, value.month, value.day)
+    return value
+
+
+def _sheet_parts(archive):
+    """([(시트 이름, 시트 XML의 zip 내부 경로)], 활성 시트 번호). 활성 시트는 openpyxl의 wb.active와 같은 시트"""
+    workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    view = workbook.find(f"{MAIN_NS}bookViews/{MAIN_NS}workbookView")
+    active = int(view.get("activeTab", 0)) if view is not None else 0
+    targets = {rel.get("Id"): rel.get("Target")
+               for rel in ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))}
+    parts = []
+    for sheet in workbook.findall(f"{MAIN_NS}sheets/{MAIN_NS}sheet"):
+        target = targets[sheet.get(f"{REL_NS}id")]
+        parts.append((sheet.get("name"), target.lstrip("/") if target.startswith("/") else f"xl/{target}"))
+    return parts, active if active < len(parts) else 0
+
+
+def sheet_names(path):
+    """(통합 문서 순서의 시트 이름 목록, 활성 시트 번호)"""
+    with zipfile.ZipFile(path) as archive:
+        parts, active = _sheet_parts(archive)
+    return [name for name, _ in parts], active
+
+
+def _shared_strings(archive, indexes):
+    """공유 문자열 표에서 indexes에 해당하는 문자열만 (가장 큰 번호까지만 읽음)"""
+    wanted = set(indexes)
+    last = max(wanted)
+    strings = {}
+    with archive.open("xl/sharedStrings.xml") as f:
+        index = 0
+        for _, element in ElementTree.iterparse(f):
+            if element.tag != f"{MAIN_NS}si":
+                continue
+            if index in wanted:
+                strings[index] = _string_item_text(element)
+            if index >= last:
+                break
+            element.clear()
+            index += 1
+    return strings
+
+
+def _string_item_text(node):
+    """문자열 항목(si/is)의 텍스트: 서식 있는 텍스트 조각(r)을 이어 붙이고 윗주(rPh)는 뺌"""
+    parts = []
+    for child in node:
+        if child.tag == f"{MAIN_NS}t":
+            parts.append(child.text or "")
+        elif child.tag == f"{MAIN_NS}r":
+            parts.append(child.findtext(f"{MAIN_NS}t") or "")
+    return "".join(parts)
+
+
+def _column_index(ref):
+    """셀 주소("AB3")의 열 번호(1부터)"""
+    col_idx = 0
+    for char in ref:
+        if not char.isalpha():
+            break
+        col_idx = col_idx * 26 + ord(char.upper()) - 64
+    return col_idx
+
+
+def _cell_value(cell):
+    """(값 또는 공유 문자열 번호, 공유 문자열 여부)"""
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        node = cell.find(f"{MAIN_NS}is")
+        return (_string_item_text(node) if node is not None else None), False
+    value = cell.findtext(f"{MAIN_NS}v")
+    if value is None:
+        return None, False
+    if cell_type == "s":
+        return int(value), True
+    if cell_type == "n":
+        return (float(value) if any(char in value for char in ".Ee") else int(value)), False
+    if cell_type == "b":
+        return value == "1", False
+    return value, False
+
+
+def read_rows(path, count, sheet=None):
+    """시트(이름, None이면 활성 시트)의 1~count행 값 튜플 목록. 시트 XML을 앞에서부터 읽다가 count행에서 멈춘다.
+
+    openpyxl read-only는 시트에 크기 정보(dimension)가 없으면 열 때 시트 전체를 훑고,
+    공유 문자열 표도 모두 읽으므로 헤더 행이나 앞쪽 몇 행만 필요할 때는 이 함수가 훨씬 빠르다.
+    날짜 서식 숫자는 숫자 그대로 돌려주므로 헤더처럼 문자열 행을 읽거나 배치를 판단할 때 쓴다.
+    """
+    rows = [{} for _ in range(count)]
+    shared = []
+    with zipfile.ZipFile(path) as archive:
+        parts, active = _sheet_parts(archive)
+        part = dict(parts)[sheet] if sheet is not None else parts[active][1]
+        with archive.open(part) as f:
+            current = 0
+            for _, element in ElementTree.iterparse(f):
+                if element.tag != f"{MAIN_NS}row":
+                    continue
+                current = int(element.get("r", current + 1))
+                if current > count:
+                    break
+                cells = rows[current - 1]
+                next_col = 1
+                for cell in element.iter(f"{MAIN_NS}c"):
+                    col_idx = _column_index(cell.get("r", "")) or next_col
+                    value, is_shared = _cell_value(cell)
+                    cells[col_idx] = value
+                    if is_shared:
+                        shared.append((cells, col_idx))
+                    next_col = col_idx + 1
+                element.clear()
+        if shared:
+            strings = _shared_strings(archive, (cells[col_idx] for cells, col_idx in shared))
+            for cells, col_idx in shared:
+                cells[col_idx] = strings.get(cells[col_idx])
+    return [tuple(cells.get(col_idx) for col_idx in range(1, max(cells, default=0) + 1)) for cells in rows]
+
+
+def read_row(path, row_no):
+    """활성 시트의 row_no번째 행 값 튜플 (read_rows 참고)"""
+    return read_rows(path, row_no)[row_no - 1]
+
+
+class CalamineSheet:
+    """python-calamine으로 읽은 시트 (sheet: 시트 이름, None이면 활성 시트)"""
+
+    backend = "calamine"
+
+    def __init__(self, path, sheet=None):
+        self._wb = CalamineWorkbook.from_path(path)
+        if sheet is not None:
+            self._sheet = self._wb.get_sheet_by_name(sheet)
+        else:
+            try:
+                _, index = sheet_names(path)
+            except (KeyError, OSError, zipfile.BadZipFile, ElementTree.ParseError):
+                index = 0  # xlsx 구조를 직접 읽을 수 없는 파일은 첫 시트
+            self._sheet = self._wb.get_sheet_by_index(index if index < len(self._wb.sheet_names) else 0)
+
+    @property
+    def max_row(self):
+        return self._sheet.end[0] + 1 if self._sheet.end else 0
+
+    def iter_rows(self):
+        # 사용 범위가 A1에서 시작하지 않으면 앞쪽 빈 행/열을 채워 openpyxl과 행/열 번호를 맞춤
+        start_row, start_col = self._sheet.start or (0, 0)
+        for _ in range(start_row):
+            yield ()
+        pad = (None,) * start_col
+        for row in self._sheet.iter_rows():
+            yield pad + tuple(map(_calamine_value, row))
+
+    def close(self):
+        self._wb.close()
+
+
+def open_sheet(path, backend="openpyxl", sheet=None):
+    """backend에 맞는 시트 읽기 객체 (auto: calamine이 있으면 calamine, 없으면 openpyxl). sheet는 시트 이름"""
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 읽기 백엔드: {backend} ({', '.join(BACKENDS)})")
+    if backend == "calamine" and not calamine_available():
+        raise ImportError("calamine 백엔드를 쓰려면 python-calamine이 필요합니다 (pip install python-calamine)")
+    if backend == "calamine" or (backend == "auto" and calamine_available()):
+        return CalamineSheet(path, sheet)
+    return OpenpyxlSheet(path, sheet)
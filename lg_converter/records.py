@@ -0,0 +1,78 @@
+"""기본 모드에서 변환과 쓰기 사이에 변환된 행을 보관하는 열 저장소
+
+행마다 LG결과 너비의 리스트와 실수 객체를 두는 대신 열별 배열로 보관한다.
+- 숫자 열(convert_to_numeric만 거치는 열, BM06): 실수는 array('d')에 8바이트씩, 실수가 있는 행인지는
+  bytearray에 1바이트씩 표시한다. 실수가 아닌 값("음성" 등)만 위치별 딕셔너리에 따로 둔다.
+  (입력의 "nan"이 변환된 실수 NaN도 실수로 그대로 보관되어 빈 값과 구분됨)
+- 그 밖의 매핑 열(EMP_NO, SSN, MDC_DATE, 범주형 열): 값 리스트
+- 소견: 값을 복사하지 않고 병원소견 색인의 값 튜플을 행마다 참조
+행을 꺼낼 때(store[위치], 반복) 기존과 같은 LG결과 너비의 값 리스트를 만들어 준다.
+
+benchmarks/bench_records 측정(20,000행)으로 보관 메모리는 값 리스트의 약 86%이다 (37.9MB → 32.8MB).
+10,000행 변환의 최대 RSS는 값 리스트로 보관할 때와 차이가 없다 (596MB, 601MB). 최대 메모리는 쓰기/저장 중에
+생기며 템플릿 서식을 유지하려고 두는 openpyxl 워크시트가 대부분을 차지하기 때문이다.
+"""
+from array import array
+
+from .helpers import convert_to_numeric
+
+
+class RecordStore:
+    """변환된 LG결과 행 저장소. 리스트처럼 len(), 반복, store[위치]로 행(값 리스트)을 꺼낼 수 있다."""
+
+    def __init__(self, plan, lg_headers):
+        self.width = max(lg_headers.values(), default=0)
+        float_columns = [lg_col for _, lg_col, converters, _ in plan if converters == (convert_to_numeric,)]
+        if "BM06" in lg_headers:
+            float_columns.append(lg_headers["BM06"])
+        float_set = set(float_columns)
+        object_columns = [lg_col for _, lg_col, _, _ in plan if lg_col not in float_set]
+        # (열 위치, 실수 배열, 실수가 있는 행 표시, 실수가 아닌 값)
+        self._floats = [(lg_col - 1, array("d"), bytearray(), {}) for lg_col in dict.fromkeys(float_columns)]
+        self._objects = [(lg_col - 1, []) for lg_col in dict.fromkeys(object_columns)]
+        self._opinions = []  # 행마다 (소견 값 튜플, 대상 열 목록) 또는 None
+        self._count = 0
+
+    def append(self, values):
+        position = self._count
+        for col_idx, numbers, present, others in self._floats:
+            value = values[col_idx]
+            if type(value) is float:
+                numbers.append(value)
+                present.append(1)
+            else:
+                numbers.append(0.0)
+                present.append(0)
+                if value is not None:
+                    others[position] = value
+        for col_idx, column in self._objects:
+            column.append(values[col_idx])
+        self._opinions.append(None)
+        self._count += 1
+
+    def extend(self, rows):
+        for values in rows:
+            self.append(values)
+
+    def fill_opinion(self, position, opinion_values, opinion_lg_cols):
+        """join.fill_opinion과 같은 결과 (값은 복사하지 않고 참조)"""
+        self._opinions[position] = (opinion_values, opinion_lg_cols)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, position):
+        values = [None] * self.width
+        for col_idx, numbers, present, others in self._floats:
+            values[col_idx] = numbers[position] if present[position] else others.get(position)
+        for col_idx, column in self._objects:
+            values[col_idx] = column[position]
+        opinion = self._opinions[position]
+        if opinion is not None:
+            for lg_col, value in zip(opinion[1], opinion[0]):
+                values[lg_col - 1] = value
+        return values
+
+    def __iter__(self):
+        for position in range(self._count):
+            yield self[position]
@@ -0,0 +1,60 @@
+"""변환 전 헤더 검사: 세 파일의 헤더 행만 보고 column_map/opinion_columns와 맞는지 확인
+
+변환이 시작되기 전에 필수 열(병원결과의 EMP_NO/SSN 원본 열, 병원소견 HO_NO/jumin, 템플릿 EMP_NO/SSN)이
+없으면 오류로, 매핑되지 않아 버려지는 열이나 찾을 수 없는 매핑 열은 경고로 모은다.
+"""
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SchemaReport:
+    """헤더 검사 결과. 각 목록은 (파일 이름, 열 이름)"""
+
+    missing_required: list = field(default_factory=list)  # 없으면 변환할 수 없는 열
+    missing_mapped: list = field(default_factory=list)  # 매핑에 있지만 파일에 없는 열 (해당 열은 비게 됨)
+    unexpected: list = field(default_factory=list)  # 파일에 있지만 매핑에 없는 열 (변환 시 버려짐)
+
+    @property
+    def ok(self):
+        return not self.missing_required
+
+    def lines(self, sample_size=10):
+        lines = []
+        for label, items in (("필수 열 없음", self.missing_required), ("매핑 열 없음", self.missing_mapped),
+                             ("매핑되지 않은 열", self.unexpected)):
+            for source in dict.fromkeys(source for source, _ in items):
+                names = [str(name) for item_source, name in items if item_source == source]
+                more = f" 외 {len(names) - sample_size}개" if len(names) > sample_size else ""
+                lines.append(f"{label} ({source} {len(names)}개): {', '.join(names[:sample_size])}{more}")
+        return lines
+
+
+def check_headers(hospital_headers, opinion_headers, lg_headers, config):
+    """세 파일의 헤더(열 이름 → 열 번호)를 매핑 설정과 비교하여 SchemaReport를 반환"""
+    report = SchemaReport()
+    column_map, opinion_columns = config.column_map, config.opinion_columns
+
+    # 매칭 키: 병원결과 EMP_NO(+SSN) 원본 열과 병원소견 HO_NO(+jumin), 템플릿 EMP_NO(+SSN)
+    key_columns = ["EMP_NO", "SSN"] if config.match_ssn else ["EMP_NO"]
+    for lg_name in key_columns:
+        sources = [header for header, target in column_map.items() if target == lg_name]
+        if not any(header in hospital_headers for header in sources):
+            report.missing_required.append(("병원결과", " 또는 ".join(sources) if sources else f"({lg_name} 매핑 없음)"))
+        if lg_name not in lg_headers:
+            report.missing_required.append(("LG결과 템플릿", lg_name))
+    for name in ["HO_NO", "jumin"] if config.match_ssn else ["HO_NO"]:
+        if name not in opinion_headers:
+            report.missing_required.append(("병원소견", name))
+
+    required = {name for _, name in report.missing_required}
+    report.missing_mapped += [("병원결과", header) for header in column_map
+                              if header not in hospital_headers and header not in required]
+    report.missing_mapped += [("병원소견", header) for header in opinion_columns if header not in opinion_headers]
+    targets = list(dict.fromkeys(list(column_map.values()) + list(opinion_columns.values())))
+    report.missing_mapped += [("LG결과 템플릿", name) for name in targets
+                              if name not in lg_headers and name not in required]
+
+    report.unexpected += [("병원결과", header) for header in hospital_headers if header not in column_map]
+    report.unexpected += [("병원소견", header) for header in opinion_headers
+                          if header not in opinion_columns and header not in ("HO_NO", "jumin")]
+    return report
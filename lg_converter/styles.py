@@ -0,0 +1,93 @@
+"""열 서식: 오른쪽 정렬/표시 형식이 필요한 LG결과 열마다 서식을 한 번만 정해 열과 셀에 지정
+
+열 서식은 (정렬, 표시 형식) 쌍이며 정렬 객체는 모든 열이 같은 것을 함께 쓴다.
+- 열: apply_column_styles가 열 정보(column_dimensions)에 정렬과 표시 형식을 한 번 지정한다.
+  값이 없는 칸은 셀을 만들지 않아도 엑셀이 열 서식으로 표시한다.
+- 값이 있는 셀: 엑셀은 셀에 저장된 서식을 열 서식보다 우선하므로 같은 서식을 셀에도 지정한다.
+  표시 형식 지정은 문자열 조회 한 번이고, 비용이 큰 정렬 지정은 오른쪽 정렬 열(CE01~CE03 등)에만 한다.
+write-only 시트는 첫 행을 쓸 때 열 정보가 저장되어 헤더를 복사한 뒤에는 열 서식을 바꿀 수 없으므로
+셀마다(WriteOnlyCell, 빈 칸 포함) 서식을 지정한다. 템플릿의 열 정보(너비, 열 서식 등)는 copy_column_dimensions로
+헤더보다 먼저 복사한다.
+"""
+from copy import copy
+
+from openpyxl.styles import Alignment
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.dimensions import ColumnDimension
+
+RIGHT = Alignment(horizontal="right")
+
+
+def apply_style(target, style):
+    """셀 또는 열 정보에 (정렬, 표시 형식) 지정"""
+    alignment, number_format = style
+    if alignment is not None:
+        target.alignment = alignment
+    if number_format is not None:
+        target.number_format = number_format
+
+
+def column_dimension(ws, col_idx):
+    """col_idx 열 하나만의 열 정보(너비 등은 그대로).
+
+    템플릿에서 여러 열을 묶은 범위(<col min max>)에 속하면 범위를 나누고(겹치는 범위가 있으면 엑셀이 파일을 복구함),
+    열 정보가 없으면 너비 없이(엑셀 기본 너비) 새로 만든다.
+    """
+    dimensions = ws.column_dimensions
+    letter = get_column_letter(col_idx)
+    for key, dimension in list(dimensions.items()):
+        dimension.reindex()
+        if dimension.min <= col_idx <= dimension.max and dimension.min != dimension.max:
+            del dimensions[key]
+            for start, end in ((dimension.min, col_idx - 1), (col_idx, col_idx), (col_idx + 1, dimension.max)):
+                if start <= end:
+                    part = copy(dimension)
+                    part.index = get_column_letter(start)
+                    part.min, part.max = start, end
+                    dimensions[part.index] = part
+            break
+    if letter not in dimensions:
+        dimensions[letter] = ColumnDimension(ws, index=letter, width=0)
+    return dimensions[letter]
+
+
+def copy_column_dimensions(ws_from, ws_to):
+    """열 정보(범위, 너비, 숨김, 윤곽 수준, 열 서식)를 다른 워크북의 시트로 복사 (write-only 시트는 첫 행을 쓰기 전에)"""
+    for key, source in ws_from.column_dimensions.items():
+        target = ws_to.column_dimensions[key]
+        target.min, target.max = source.min, source.max
+        target.width = source.width
+        target.bestFit = source.bestFit
+        target.hidden = source.hidden
+        target.outlineLevel = source.outlineLevel
+        target.collapsed = source.collapsed
+        if source.has_style:
+            target.font = copy(source.font)
+            target.fill = copy(source.fill)
+            target.border = copy(source.border)
+            target.alignment = copy(source.alignment)
+            target.protection = copy(source.protection)
+            target.number_format = source.number_format
+
+
+def apply_column_styles(ws, styles):
+    """열 서식 지정 (styles: column_styles 결과). 값이 없는 칸은 이 서식으로 보임"""
+    for lg_col, style in styles.items():
+        apply_style(column_dimension(ws, lg_col), style)
+
+
+def column_styles(lg_headers, plan, config):
+    """LG결과 열 번호 → (정렬 또는 None, 표시 형식 또는 None). 오른쪽 정렬 열과 표시 형식이 지정된 열만 포함
+
+    표시 형식은 config.column_formats에 적힌 열별 형식이 우선이고,
+    없으면 numeric_columns에 속한 열에 config.numeric_format을 쓴다.
+    """
+    right_align_cols = {lg_col for _, lg_col, _, right_align in plan if right_align}
+    styles = {}
+    for name, lg_col in lg_headers.items():
+        number_format = config.column_formats.get(name)
+        if number_format is None and name in config.numeric_columns:
+            number_format = config.numeric_format
+        if number_format or lg_col in right_align_cols:
+            styles[lg_col] = (RIGHT if lg_col in right_align_cols else None, number_format)
+    return styles
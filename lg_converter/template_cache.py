@@ -0,0 +1,100 @@
+"""LG결과 템플릿 캐시: 헤더 행까지만 남긴 템플릿 사본과 헤더 배치를 저장해 두고 다음 실행에서 그대로 사용
+
+캐시는 템플릿 폴더가 아닌 사용자 캐시 폴더(cache_dir)에 템플릿마다(절대 경로의 해시) 두 파일로 둔다.
+    <해시>.json   버전, 헤더 행 번호, 템플릿 (크기, 수정 시각), sha256, 헤더 딕셔너리, 사본 (크기, 수정 시각)
+    <해시>.xlsx   헤더 행 다음부터 삭제한 템플릿 (서식/열 너비 등은 그대로)
+
+템플릿의 크기와 수정 시각이 같으면 바로 캐시를 쓰고, 다르면 sha256을 비교하여 내용이 같을 때만 쓴다.
+캐시 폴더에 쓸 수 없으면 알리지 않고 캐시 없이 매번 템플릿을 읽는다.
+여러 프로세스가 같은 템플릿을 동시에 캐시해도 되도록 고유한 이름의 임시 파일에 쓴 뒤 교체한다.
+설명 파일의 사본 (크기, 수정 시각)이 실제 사본과 다르면(다른 프로세스가 사본을 바꿈) 캐시를 쓰지 않고 다시 만든다.
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+
+from .files import file_digest, file_stamp, replace_file, user_cache_dir
+
+CACHE_VERSION = 2
+
+
+@dataclass
+class TemplateLayout:
+    """캐시된 템플릿 배치"""
+
+    path: str  # 불러올 파일 (헤더 행까지만 남긴 사본)
+    lg_headers: dict  # 헤더 → 열 번호(1부터)
+
+
+def cache_dir():
+    """템플릿 캐시 폴더 (사용자 캐시 폴더 아래 lg_converter/templates)"""
+    return user_cache_dir("templates")
+
+
+def cache_paths(template_file):
+    """(설명 파일, 헤더 행까지만 남긴 사본) 경로"""
+    name = hashlib.sha256(os.path.abspath(template_file).encode("utf-8")).hexdigest()[:32]
+    base = os.path.join(cache_dir(), name)
+    return f"{base}.json", f"{base}.xlsx"
+
+
+def _read_descriptor(descriptor_file):
+    try:
+        with open(descriptor_file, encoding="utf-8") as f:
+            descriptor = json.load(f)
+        return descriptor if descriptor.get("version") == CACHE_VERSION else None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _write_descriptor(descriptor_file, descriptor):
+    def write(temp_file):
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(descriptor, f, ensure_ascii=False)
+
+    try:
+        replace_file(descriptor_file, write)
+    except OSError:
+        pass
+
+
+def lookup(template_file, header_row):
+    """템플릿이 캐시를 만든 때와 같으면 TemplateLayout, 아니면(또는 캐시가 없으면) None"""
+    descriptor_file, trimmed_file = cache_paths(template_file)
+    try:
+        stamp = list(file_stamp(template_file))
+        trimmed_stamp = list(file_stamp(trimmed_file))
+    except OSError:
+        return None
+    descriptor = _read_descriptor(descriptor_file)
+    if descriptor is None or descriptor["header_row"] != header_row or descriptor["trimmed"] != trimmed_stamp:
+        return None
+    if descriptor["template"] != stamp:
+        # 복사/체크아웃 등으로 수정 시각만 바뀐 경우: 내용이 같으면 새 시각을 기록하고 계속 사용
+        if file_digest(template_file) != descriptor["sha256"]:
+            return None
+        descriptor["template"] = stamp
+        _write_descriptor(descriptor_file, descriptor)
+    return TemplateLayout(trimmed_file, dict(descriptor["lg_headers"]))
+
+
+def store(template_file, header_row, wb, lg_headers):
+    """헤더 행 다음부터 삭제한 템플릿 워크북 wb를 사본으로 저장하고 설명 파일을 기록 (실패하면 캐시 없이 진행)"""
+    descriptor_file, trimmed_file = cache_paths(template_file)
+    try:
+        os.makedirs(cache_dir(), exist_ok=True)
+        stamp = list(file_stamp(template_file))
+        digest = file_digest(template_file)
+        replace_file(trimmed_file, wb.save)
+        trimmed_stamp = list(file_stamp(trimmed_file))
+    except OSError:
+        return
+    _write_descriptor(descriptor_file, {
+        "version": CACHE_VERSION,
+        "header_row": header_row,
+        "template": stamp,
+        "sha256": digest,
+        "lg_headers": dict(lg_headers),
+        "trimmed": trimmed_stamp,
+    })
@@ -0,0 +1,260 @@
+"""변환 결과 검증: 병원결과/병원소견과 결과 파일을 나란히 스트리밍으로 읽어 모든 열의 기대 값을 다시 계산하여 비교
+
+- 결과 파일(xlsx/csv/parquet)의 헤더로 변환 계획을 만들고, 병원결과 행마다 변환과 같은 변환 함수(plan),
+  BM06 계산, 소견 매칭으로 기대 행을 만든다. 결과 파일은 read-only로 읽고 서식은 보지 않는다.
+- 기대 행과 결과 행은 순서대로 짝짓고, 매칭 키(사번+주민번호)가 다르면(증분 변환으로 순서가 바뀐 경우 등)
+  같은 키의 행이 나올 때까지 양쪽 행을 보관한다. 끝까지 짝이 없는 행은 결과 누락/추가 행으로 센다.
+- 숫자는 값으로 비교하고(7과 7.0은 같음) 빈 문자열, 공백만 있는 문자열과 빈 칸은 같게 본다.
+  csv/parquet은 저장할 때와 같은 문자열 표기로 비교한다.
+불일치는 열별/사원별 수로 요약하고, 전체 목록은 결과 파일 옆 CSV(<결과 파일>.검증.csv)로 저장한다.
+"""
+import csv
+import math
+import os
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from itertools import islice, zip_longest
+
+from . import readers
+from .engine import ConversionError, ConvertConfig, Report, hospital_spec, load_opinion_index, open_input
+from .join import fill_opinion, format_key, key_columns, row_key
+from .memo import ConverterMemo
+from .plan import build_transform_plan, iter_transformed_rows
+from .writers import FLAT_FORMATS, _text, output_format
+
+VERIFY_HEADER = ["구분", "결과 행", "병원결과 행", "사번", "주민번호", "열", "기대 값", "결과 값"]
+MAX_DETAILS = 100000  # 목록에 남길 최대 불일치 수 (수는 모두 셈)
+
+
+def verify_report_path(output_file):
+    """검증 리포트 파일 이름 (예: LG결과_변환.검증.csv)"""
+    return f"{os.path.splitext(output_file)[0]}.검증.csv"
+
+
+@dataclass
+class VerifyReport:
+    """검증 결과 요약"""
+
+    output_file: str
+    rows: int = 0  # 짝지어 비교한 행 수
+    expected_rows: int = 0
+    output_rows: int = 0
+    columns: int = 0
+    column_counts: Counter = field(default_factory=Counter)  # 열 이름 → 불일치 수
+    employee_counts: Counter = field(default_factory=Counter)  # 매칭 키 → 불일치 열 수
+    mismatches: list = field(default_factory=list)  # (결과 행, 병원결과 행, 키, 열 이름, 기대 값, 결과 값)
+    missing_rows: list = field(default_factory=list)  # 결과에 없는 (병원결과 행, 키)
+    extra_rows: list = field(default_factory=list)  # 병원결과에 없는 (결과 행, 키)
+    report_file: str = None
+    elapsed: float = 0.0
+
+    @property
+    def mismatch_count(self):
+        return sum(self.column_counts.values())
+
+    @property
+    def ok(self):
+        return not (self.column_counts or self.missing_rows or self.extra_rows)
+
+    def summary_lines(self, sample_size=10):
+        lines = [f"비교: {self.rows}행 x {self.columns}열 (병원결과 {self.expected_rows}행, 결과 {self.output_rows}행)"]
+        if self.ok:
+            lines.append("검증 통과: 모든 값이 일치합니다.")
+        else:
+            lines.append(f"불일치 {self.mismatch_count:,}칸 (사원 {len(self.employee_counts)}명), "
+                         f"결과 누락 {len(self.missing_rows)}행, 결과 추가 {len(self.extra_rows)}행")
+            for name, count in self.column_counts.most_common(sample_size):
+                lines.append(f"  열 {name}: {count:,}칸")
+            for key, count in self.employee_counts.most_common(sample_size):
+                lines.append(f"  사원 {format_key(key)}: {count}열")
+            if self.report_file:
+                lines.append(f"불일치 전체 목록: {self.report_file}")
+        lines.append(f"검증 시간 {self.elapsed:.2f}초")
+        return lines
+
+
+def _normalize(value):
+    if isinstance(value, str) and not value.strip():
+        return None
+    return value
+
+
+def same_value(expected, actual):
+    expected, actual = _normalize(expected), _normalize(actual)
+    if expected is None or actual is None:
+        return expected is actual
+    numbers = (int, float)
+    if isinstance(expected, numbers) and isinstance(actual, numbers) \
+            and not isinstance(expected, bool) and not isinstance(actual, bool):
+        if math.isnan(expected) or math.isnan(actual):
+            return math.isnan(expected) and math.isnan(actual)
+        return math.isclose(expected, actual, rel_tol=1e-12)
+    return expected == actual
+
+
+def _flat_rows(path, fmt):
+    """csv/parquet 결과 파일의 (헤더 행, 데이터 행 제너레이터)"""
+    if fmt == "csv":
+        def rows():
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                yield from csv.reader(f)
+        data = rows()
+        return tuple(next(data, ())), data
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ConversionError("Parquet 결과를 검증하려면 pyarrow가 필요합니다 (pip install pyarrow)") from None
+    parquet = pq.ParquetFile(path)
+
+    def rows():
+        # 숫자 열(int64/float64)도 csv와 같은 문자열 표기로 바꿔 비교
+        for batch in parquet.iter_batches():
+            yield from zip(*([_text(value) for value in column.to_pylist()] for column in batch.columns))
+    return tuple(parquet.schema_arrow.names), rows()
+
+
+def open_output(output_file, config, fmt):
+    """결과 파일을 read-only로 열어 (헤더 딕셔너리, 데이터 행 제너레이터, 첫 데이터 행 번호, 닫기 함수)"""
+    if not os.path.exists(output_file):
+        raise ConversionError(f"결과 파일을 찾을 수 없습니다: {output_file}")
+    if fmt in FLAT_FORMATS:
+        header, rows = _flat_rows(output_file, fmt)
+        return {name: col_idx for col_idx, name in enumerate(header, 1) if name}, rows, 2, rows.close
+    try:
+        sheet = readers.open_sheet(output_file, config.reader)
+    except Exception as e:
+        raise ConversionError(f"결과 파일 처리 중 문제 발생: {output_file} ({e})") from e
+    rows = iter(sheet.iter_rows())
+    header = next(islice(rows, config.template_header_row - 1, None), ())
+    headers = {value: col_idx for col_idx, value in enumerate(header, 1) if value}
+    return headers, rows, config.template_header_row + 1, sheet.close
+
+
+def _is_blank(values):
+    return all(_normalize(value) is None for value in values)
+
+
+def verify_output(hospital_file, opinion_file, output_file, config=None, *, log=print, save_report=True):
+    """output_file이 hospital_file/opinion_file을 변환한 결과와 같은지 모든 열을 비교하여 VerifyReport를 반환"""
+    config = config or ConvertConfig()
+    start = time.perf_counter()
+    fmt = output_format(output_file, config.output_format)
+    as_text = fmt in FLAT_FORMATS  # csv/parquet: 기대 값을 저장할 때와 같은 문자열 표기로 바꿔 비교
+    report = VerifyReport(output_file)
+
+    lg_headers, output_rows, output_first_row, close_output = open_output(output_file, config, fmt)
+    source = None
+    try:
+        if "EMP_NO" not in lg_headers:
+            raise ConversionError(f"결과 파일 {config.template_header_row}행에 EMP_NO 헤더가 없습니다: {output_file}")
+        names = {col_idx: name for name, col_idx in lg_headers.items()}
+        width = max(lg_headers.values(), default=0)
+        report.columns = len(lg_headers)
+        opinion_index, opinion_lg_cols = load_opinion_index(opinion_file, lg_headers, config, Report(output_file), log)
+
+        source = open_input(hospital_file, hospital_spec(config), config, log)
+        plan = build_transform_plan(source.headers, lg_headers, config.column_map, config.numeric_columns,
+                                    config.right_align_columns)
+        emp_no_idx, ssn_idx = key_columns(lg_headers)
+        memo = ConverterMemo(config.memo_size) if config.memo_size else None
+
+        def expected_rows():
+            for position, values in enumerate(iter_transformed_rows(source.rows(), plan, lg_headers, memo)):
+                key = row_key(values, emp_no_idx, ssn_idx, config.match_ssn)
+                opinion = opinion_index.get(key)
+                if opinion is not None:
+                    fill_opinion(values, opinion[1], opinion_lg_cols)
+                if as_text:
+                    values = [_text(value) for value in values]
+                yield source.first_row_no + position, key, values
+
+        def actual_rows():
+            for row_no, row in enumerate(output_rows, output_first_row):
+                values = list(islice(row, width)) + [None] * (width - len(row))
+                yield row_no, row_key(values, emp_no_idx, ssn_idx, config.match_ssn), values
+
+        def compare_rows(expected, actual):
+            source_row_no, key, expected_values = expected
+            output_row_no, _, actual_values = actual
+            report.rows += 1
+            for col_idx, (expected_value, actual_value) in enumerate(zip(expected_values, actual_values), 1):
+                if expected_value == actual_value:  # 대부분의 칸은 값이 그대로 같음
+                    continue
+                if col_idx in names and not same_value(expected_value, actual_value):
+                    name = names[col_idx]
+                    report.column_counts[name] += 1
+                    report.employee_counts[key] += 1
+                    if len(report.mismatches) < MAX_DETAILS:
+                        report.mismatches.append((output_row_no, source_row_no, key, name, expected_value,
+                                                  actual_value))
+
+        # 순서대로 짝짓고, 키가 다르면 같은 키의 행이 나올 때까지 보관
+        pending_expected, pending_actual = {}, {}
+        for expected, actual in zip_longest(expected_rows(), actual_rows()):
+            if expected is not None:
+                report.expected_rows += 1
+            if actual is not None:
+                report.output_rows += 1
+            if expected is not None and actual is not None and expected[1] == actual[1]:
+                compare_rows(expected, actual)
+                continue
+            if expected is not None:
+                waiting = pending_actual.get(expected[1])
+                if waiting:
+                    compare_rows(expected, waiting.popleft())
+                else:
+                    pending_expected.setdefault(expected[1], deque()).append(expected)
+            if actual is not None:
+                waiting = pending_expected.get(actual[1])
+                if waiting:
+                    compare_rows(waiting.popleft(), actual)
+                else:
+                    pending_actual.setdefault(actual[1], deque()).append(actual)
+
+        # 짝이 없는 빈 행(시트 끝의 빈 행 등)은 세지 않음
+        report.missing_rows = [(row_no, key) for rows in pending_expected.values()
+                               for row_no, key, values in rows if not _is_blank(values)]
+        report.extra_rows = [(row_no, key) for rows in pending_actual.values()
+                             for row_no, key, values in rows if not _is_blank(values)]
+        report.missing_rows.sort()
+        report.extra_rows.sort()
+    finally:
+        if source is not None:
+            source.close()
+        close_output()
+
+    if save_report:
+        path = verify_report_path(output_file)
+        if not report.ok:
+            try:
+                write_verify_report(path, report)
+                report.report_file = path
+            except OSError as e:
+                log(f"경고: 검증 리포트를 저장하지 못했습니다: {path} ({e})")
+        elif os.path.exists(path):
+            os.remove(path)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def write_verify_report(path, report):
+    """불일치/누락/추가 행 전체를 엑셀에서 바로 열 수 있는 CSV(UTF-8 BOM)로 저장"""
+    def split(key):
+        key = key or ()
+        return (key[0] if len(key) > 0 else "", key[1] if len(key) > 1 else "")
+
+    def text(value):
+        return "" if value is None else value
+
+    temp_file = f"{path}.tmp"
+    with open(temp_file, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(VERIFY_HEADER)
+        for output_row_no, source_row_no, key, name, expected, actual in report.mismatches:
+            writer.writerow(["값 불일치", output_row_no, source_row_no, *split(key), name, text(expected), text(actual)])
+        for row_no, key in report.missing_rows:
+            writer.writerow(["결과 누락", "", row_no, *split(key), "", "", ""])
+        for row_no, key in report.extra_rows:
+            writer.writerow(["결과 추가", row_no, "", *split(key), "", "", ""])
+    os.replace(temp_file, path)
@@ -0,0 +1,146 @@
+"""LG결과를 xlsx 템플릿 대신 CSV/Parquet으로 바로 쓰는 평면 파일 writer
+
+열은 템플릿 헤더 행의 순서를 그대로 따르고, 행을 받는 대로 임시 파일에 써서 메모리를 늘리지 않는다.
+close()에서 임시 파일을 결과 파일로 교체하므로 취소/오류 시(abort) 반쯤 쓰인 결과 파일이 남지 않는다.
+숫자는 xlsx에 저장했다 읽었을 때와 같은 표기(7.0 → "7")로 쓴다.
+Parquet은 pyarrow가 필요하며(선택), 열마다 타입을 정해 저장한다: 빈 값이 아닌 값이 모두 정수면 int64,
+모두 숫자면 float64, 문자("음성" 등)가 하나라도 섞이면 위와 같은 표기의 문자열.
+타입은 모든 행을 본 뒤에야 정해지므로 쓰는 동안에는 문자열 열의 임시 파일(<결과>.spool.tmp)에 row group 단위로
+저장하고, close()에서 묶음씩 읽어 열 타입으로 바꿔 결과 파일에 다시 쓴다 (메모리는 묶음 크기만큼만 사용).
+"""
+import csv
+import os
+
+pa = pq = None  # pyarrow는 Parquet으로 저장할 때만 불러옴 (_import_pyarrow)
+
+FLAT_FORMATS = ("csv", "parquet")
+PARQUET_BATCH_SIZE = 10000
+
+# Parquet 열 타입을 정하기 위한 값 종류 (열의 종류는 값 종류 중 가장 큰 것)
+NONE_KIND, INT_KIND, FLOAT_KIND, TEXT_KIND = range(4)
+INT64_RANGE = range(-2 ** 63, 2 ** 63)
+
+
+def _import_pyarrow():
+    global pa, pq
+    if pq is None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            return
+        pa, pq = pyarrow, pyarrow.parquet
+
+
+def output_format(output_file, requested=None):
+    """requested가 없으면 결과 파일 확장자로 형식을 정함 (.csv, .parquet, 그 밖에는 xlsx)"""
+    if requested:
+        return requested
+    ext = os.path.splitext(output_file)[1].lower()
+    return ext[1:] if ext[1:] in FLAT_FORMATS else "xlsx"
+
+
+def _text(value):
+    """xlsx에 저장했다 읽었을 때와 같은 표기 (7.0 → "7")"""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _kind(value):
+    if value is None:
+        return NONE_KIND
+    if type(value) is int:
+        return INT_KIND if value in INT64_RANGE else TEXT_KIND
+    if type(value) is float:
+        return FLOAT_KIND
+    return TEXT_KIND
+
+
+class CsvWriter:
+    """엑셀에서 바로 열 수 있도록 UTF-8 BOM으로 저장"""
+
+    def __init__(self, path, headers):
+        self.path = path
+        self.temp_file = f"{path}.tmp"
+        self._file = open(self.temp_file, "w", newline="", encoding="utf-8-sig")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(headers)
+
+    def write(self, values):
+        self._writer.writerow([_text(value) or "" for value in values])
+
+    def close(self):
+        self._file.close()
+        os.replace(self.temp_file, self.path)
+
+    def abort(self):
+        self._file.close()
+        if os.path.exists(self.temp_file):
+            os.remove(self.temp_file)
+
+
+class ParquetWriter:
+    """PARQUET_BATCH_SIZE 행씩 모아 row group으로 저장하고, 닫을 때 열마다 정한 타입으로 바꿔 씀"""
+
+    def __init__(self, path, headers, batch_size=PARQUET_BATCH_SIZE):
+        _import_pyarrow()
+        if pq is None:
+            raise ImportError("Parquet으로 저장하려면 pyarrow가 필요합니다 (pip install pyarrow)")
+        self.path = path
+        self.temp_file = f"{path}.tmp"
+        self.spool_file = f"{path}.spool.tmp"
+        self._names = [str(header) for header in headers]
+        self._spool_schema = pa.schema([(name, pa.string()) for name in self._names])
+        self._spool = pq.ParquetWriter(self.spool_file, self._spool_schema)
+        self._kinds = [NONE_KIND] * len(self._names)
+        self._batch_size = batch_size
+        self._batch = []
+
+    def write(self, values):
+        self._batch.append(values)
+        if len(self._batch) >= self._batch_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._batch:
+            return
+        columns = list(zip(*self._batch))
+        for col_idx, column in enumerate(columns):
+            if self._kinds[col_idx] != TEXT_KIND:
+                self._kinds[col_idx] = max(self._kinds[col_idx], max(map(_kind, column)))
+        arrays = [pa.array([_text(value) for value in column], type=pa.string()) for column in columns]
+        self._spool.write_table(pa.Table.from_arrays(arrays, schema=self._spool_schema))
+        self._batch = []
+
+    def close(self):
+        self._flush()
+        self._spool.close()
+        types = [{INT_KIND: pa.int64(), FLOAT_KIND: pa.float64()}.get(kind, pa.string()) for kind in self._kinds]
+        schema = pa.schema(list(zip(self._names, types)))
+        spool = pq.ParquetFile(self.spool_file)
+        try:
+            with pq.ParquetWriter(self.temp_file, schema) as writer:
+                for batch in spool.iter_batches(batch_size=self._batch_size):
+                    columns = [column.cast(column_type) for column, column_type in zip(batch.columns, types)]
+                    writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+        finally:
+            spool.close()
+        os.remove(self.spool_file)
+        os.replace(self.temp_file, self.path)
+
+    def abort(self):
+        self._spool.close()
+        for temp_file in (self.spool_file, self.temp_file):
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+
+def open_flat_writer(fmt, path, headers):
+    if fmt == "csv":
+        return CsvWriter(path, headers)
+    if fmt == "parquet":
+        return ParquetWriter(path, headers)
+    raise ValueError(f"알 수 없는 출력 형식: {fmt} (xlsx, csv, parquet)")
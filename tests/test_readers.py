@@ -0,0 +1,99 @@
+"""openpyxl과 calamine 읽기 백엔드 비교: 시트 값과 변환 결과
+
+    python -m pytest tests
+"""
+import datetime
+
+import openpyxl
+import pytest
+
+from benchmarks.synthetic import CATEGORY_VALUES
+from benchmarks.workbooks import generate
+from lg_converter import COLUMN_MAP, NUMERIC_COLUMNS, ConvertConfig, convert, readers
+
+pytestmark = pytest.mark.skipif(not readers.calamine_available(), reason="python-calamine이 설치되어 있지 않음")
+
+
+def read_all(path, backend):
+    sheet = readers.open_sheet(path, backend)
+    try:
+        return [trim(row) for row in sheet.iter_rows()]
+    finally:
+        sheet.close()
+
+
+def trim(row):
+    row = list(row)
+    while row and row[-1] is None:
+        row.pop()
+    return row
+
+
+def write_sheet(path, rows):
+    wb = openpyxl.Workbook()
+    for row in rows:
+        wb.active.append(row)
+    wb.save(path)
+
+
+def test_same_values(tmp_path):
+    path = str(tmp_path / "values.xlsx")
+    write_sheet(path, [
+        ["사번", "이름", "키", "체중", "검사일"],
+        [100001, "홍길동", 172.5, 70, datetime.datetime(2024, 3, 5)],
+        ["100002", " 앞 공백", 7.0, None, datetime.datetime(2024, 3, 6, 9, 30)],
+        [None, None, 123456789012, -0.25, "20240307"],
+    ])
+    assert read_all(path, "calamine") == read_all(path, "openpyxl")
+
+
+def test_known_differences(tmp_path):
+    """readers 모듈 설명의 차이: 공백만 있는 문자열과 오류 값을 calamine은 빈 칸으로 읽음"""
+    path = str(tmp_path / "blank.xlsx")
+    write_sheet(path, [["A", "B", "C"], [" ", "#N/A", 1]])
+    assert read_all(path, "openpyxl")[1] == [" ", "#N/A", 1]
+    assert read_all(path, "calamine")[1] == [None, None, 1]
+
+
+def test_default_reader_is_openpyxl():
+    assert ConvertConfig().reader == "openpyxl"
+
+
+def convert_both(hospital_file, opinion_file, template_file, directory):
+    """{백엔드: 변환 결과 행 목록}"""
+    outputs = {}
+    for backend in ("openpyxl", "calamine"):
+        output_file = str(directory / f"{backend}.xlsx")
+        convert(hospital_file, opinion_file, template_file, output_file, ConvertConfig(reader=backend),
+                log=lambda message: None)
+        outputs[backend] = read_all(output_file, "openpyxl")
+    return outputs
+
+
+def test_conversion_outputs(tmp_path):
+    """같은 입력의 변환 결과는 openpyxl의 공백만 있는 문자열이 calamine에서 빈 칸이 되는 것 말고는 같음"""
+    outputs = convert_both(*generate(str(tmp_path), 200), tmp_path)
+    expected, actual = outputs["openpyxl"], outputs["calamine"]
+    assert len(expected) == len(actual)
+    for left, right in zip(expected, actual):
+        width = max(len(left), len(right))
+        for a, b in zip(left + [None] * (width - len(left)), right + [None] * (width - len(right))):
+            if not (isinstance(a, str) and not a.strip() and b is None):
+                assert (type(a), a) == (type(b), b)
+
+
+def test_whitespace_text_column(tmp_path):
+    """변환기가 없는 문자열 열의 " "는 기본(openpyxl)에서는 그대로, calamine에서는 빈 칸으로 나옴"""
+    hospital_file, opinion_file, template_file = generate(str(tmp_path), 20)
+    wb = openpyxl.load_workbook(hospital_file)
+    ws = wb.active
+    headers = [cell.value for cell in ws[3]]
+    col_idx = next(col_idx for col_idx, header in enumerate(headers, 1)
+                   if COLUMN_MAP.get(header) not in NUMERIC_COLUMNS and ws.cell(5, col_idx).value in CATEGORY_VALUES)
+    ws.cell(5, col_idx).value = " "
+    wb.save(hospital_file)
+
+    outputs = convert_both(hospital_file, opinion_file, template_file, tmp_path)
+    lg_col = outputs["openpyxl"][2].index(COLUMN_MAP[headers[col_idx - 1]])
+    assert outputs["openpyxl"][3][lg_col] == " "
+    assert outputs["calamine"][3][lg_col] is None
@@ -0,0 +1,51 @@
+"""변환 결과 검증: 병원결과/병원소견을 다시 변환한 기대 값과 결과 파일의 값을 모든 열에서 비교
+
+사용 예:
+    python verify.py                                                   # 기본 파일 이름 (main.py와 같음)
+    python verify.py --hospital 병원결과.xlsx --opinion 병원소견.xlsx --output LG결과_변환.xlsx
+    python verify.py --output LG결과_변환.csv --mapping 매핑.json
+
+변환할 때와 같은 옵션(--mapping, --layout, --ho-no-only 등)으로 실행해야 한다.
+불일치가 있으면 열별/사원별 요약을 출력하고 전체 목록을 <output>.검증.csv로 저장하며 종료 코드 1로 끝난다.
+"""
+import argparse
+import sys
+
+from lg_converter import ConversionError, ConvertConfig, load_mapping, verify_output
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LG결과 변환 결과 검증")
+    parser.add_argument("--hospital", nargs="+", default="병원결과.xlsx",
+                        help="병원결과 파일 (검사 결과를 나눠 보낸 경우 여러 개)")
+    parser.add_argument("--opinion", nargs="+", default="병원소견.xlsx", help="병원소견 파일 (여러 개 가능)")
+    parser.add_argument("--output", default="LG결과_변환.xlsx", help="검증할 결과 파일 (xlsx/csv/parquet)")
+    parser.add_argument("--format", choices=["xlsx", "csv", "parquet"], help="결과 형식 (기본: --output 확장자)")
+    parser.add_argument("--ho-no-only", action="store_true",
+                        help="소견 매칭 시 jumin/SSN은 비교하지 않고 HO_NO/EMP_NO만 비교")
+    parser.add_argument("--reader", choices=["auto", "openpyxl", "calamine"], default="openpyxl",
+                        help="xlsx 읽기 (calamine: 빠르지만 공백만 있는 칸과 오류 값을 빈 칸으로 읽음, auto: calamine이 설치되어 있으면 사용)")
+    parser.add_argument("--layout", choices=["fixed", "auto"], default="fixed",
+                        help="입력 배치 (변환할 때와 같게 지정)")
+    parser.add_argument("--mapping", help="열 매핑 설정 파일 (json/yaml/csv, 생략 시 기본 매핑)")
+    parser.add_argument("--no-report", action="store_true", help="불일치 목록 CSV(<output>.검증.csv)를 저장하지 않음")
+    parser.add_argument("--top", type=int, default=10, help="요약에 출력할 열/사원 수")
+    args = parser.parse_args()
+
+    try:
+        mapping = load_mapping(args.mapping) if args.mapping else {}
+        config = ConvertConfig(
+            match_ssn=not args.ho_no_only,
+            output_format=args.format,
+            reader=args.reader,
+            input_layout=args.layout,
+            **mapping,
+        )
+        report = verify_output(args.hospital, args.opinion, args.output, config, save_report=not args.no_report)
+    except ConversionError as e:
+        print(f"에러: {e}")
+        sys.exit(1)
+
+    print("\n=== 검증 요약 ===")
+    for line in report.summary_lines(args.top):
+        print(line)
+    sys.exit(0 if report.ok else 1)
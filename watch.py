@@ -0,0 +1,218 @@
+"""입력 폴더를 감시하여 병원결과/병원소견 파일 쌍이 들어오면 자동으로 변환하는 무인 실행 모드
+
+사용 예:
+    python watch.py 입력폴더 --outbox 결과폴더 --template LG결과.xlsx
+    python watch.py 입력폴더 --outbox 결과폴더 --max-jobs 2 --interval 5
+    python watch.py 입력폴더 --outbox 결과폴더 --once     # 지금 있는 파일만 처리하고 종료
+
+- 이름의 '병원결과'를 '병원소견'으로 바꾼 파일이 있으면 한 쌍으로 보고(batch.py와 같은 규칙),
+  두 파일의 크기와 수정 시각이 한 번의 확인 간격 동안 그대로일 때(복사가 끝났을 때)만 작업으로 등록한다.
+- 등록한 입력 파일은 결과 폴더의 .queue/<작업 ID>/로 옮기고 작업 목록(.queue.json)에 기록하므로,
+  중간에 종료해도 다시 실행하면 끝나지 않은 작업부터 이어서 변환한다.
+- 변환 결과와 로그/매칭 리포트는 결과 폴더에, 처리한 입력 파일은 --archive 폴더의 처리완료/실패 폴더로 옮긴다.
+- 동시에 변환하는 작업은 --max-jobs개까지이다.
+"""
+import argparse
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from batch import HOSPITAL_KEYWORD, OPINION_KEYWORD, OUTPUT_KEYWORD, run_job
+from lg_converter import ConversionError, ConvertConfig, load_mapping
+
+QUEUE_FILE = ".queue.json"
+STAGING_DIR = ".queue"
+DONE_DIR = "처리완료"
+FAILED_DIR = "실패"
+HISTORY_SIZE = 500  # 작업 목록에 남길 끝난 작업 수
+
+
+class JobQueue:
+    """결과 폴더의 .queue.json에 저장되는 작업 목록 (상태: 대기/변환중/완료/실패)"""
+
+    def __init__(self, outbox):
+        self.path = os.path.join(outbox, QUEUE_FILE)
+        self.jobs = []
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                self.jobs = json.load(f)
+        # 이전 실행이 변환 도중 종료된 작업은 다시 대기로
+        for job in self.jobs:
+            if job["status"] == "변환중":
+                job["status"] = "대기"
+
+    def save(self):
+        finished = [job for job in self.jobs if job["status"] in ("완료", "실패")]
+        if len(finished) > HISTORY_SIZE:
+            drop = {id(job) for job in finished[:len(finished) - HISTORY_SIZE]}
+            self.jobs = [job for job in self.jobs if id(job) not in drop]
+        temp_file = f"{self.path}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(self.jobs, f, ensure_ascii=False, indent=1)
+        os.replace(temp_file, self.path)
+
+    def pending(self):
+        return [job for job in self.jobs if job["status"] == "대기"]
+
+    def add(self, job):
+        self.jobs.append(job)
+        self.save()
+
+
+def new_job_id():
+    """등록 시각 순으로 정렬되는 작업 ID (예: 20240501_093012_123456)"""
+    now = time.time_ns()
+    return time.strftime("%Y%m%d_%H%M%S", time.localtime(now // 1000000000)) + f"_{now // 1000 % 1000000:06d}"
+
+
+def unique_path(path, job_id, taken=()):
+    """같은 이름의 파일이 이미 있거나 다른 작업이 쓸 예정이면 이름 앞에 작업 ID를 붙임"""
+    if not os.path.exists(path) and path not in taken:
+        return path
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f"{job_id}_{name}")
+
+
+def find_ready_pairs(inbox, previous):
+    """(복사가 끝난(직전 확인과 크기/수정 시각이 같은) 병원결과/병원소견 쌍 목록, 아직 복사 중인 쌍 수, 이번 확인 결과)"""
+    current = {}
+    for entry in os.scandir(inbox):
+        if entry.is_file() and entry.name.endswith(".xlsx") and not entry.name.startswith("~$"):
+            stat = entry.stat()
+            current[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    pairs = []
+    waiting = 0
+    for name in sorted(current):
+        if HOSPITAL_KEYWORD not in name:
+            continue
+        opinion_name = name.replace(HOSPITAL_KEYWORD, OPINION_KEYWORD)
+        if opinion_name not in current:
+            continue
+        if all(previous.get(n) == current[n] for n in (name, opinion_name)):
+            pairs.append((name, opinion_name))
+        else:
+            waiting += 1
+    return pairs, waiting, current
+
+
+def enqueue(queue, inbox, outbox, name, opinion_name):
+    """입력 파일 쌍을 결과 폴더의 대기 폴더로 옮기고 작업 목록에 등록"""
+    job_id = new_job_id()
+    staging = os.path.join(outbox, STAGING_DIR, job_id)
+    os.makedirs(staging)
+    hospital_file = os.path.join(staging, name)
+    opinion_file = os.path.join(staging, opinion_name)
+    shutil.move(os.path.join(inbox, name), hospital_file)
+    shutil.move(os.path.join(inbox, opinion_name), opinion_file)
+    taken = {job["output"] for job in queue.jobs if job["status"] in ("대기", "변환중")}
+    output_file = unique_path(os.path.join(outbox, name.replace(HOSPITAL_KEYWORD, OUTPUT_KEYWORD)), job_id, taken)
+    queue.add({
+        "id": job_id,
+        "status": "대기",
+        "hospital": hospital_file,
+        "opinion": opinion_file,
+        "output": output_file,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+    })
+    print(f"[등록] {job_id}: {name}")
+
+
+def archive_inputs(job, archive):
+    """처리한 입력 파일을 처리완료/실패 폴더로 옮김"""
+    target_dir = os.path.join(archive, FAILED_DIR if job["status"] == "실패" else DONE_DIR)
+    os.makedirs(target_dir, exist_ok=True)
+    for key in ("hospital", "opinion"):
+        if os.path.exists(job[key]):
+            target = unique_path(os.path.join(target_dir, os.path.basename(job[key])), job["id"])
+            shutil.move(job[key], target)
+            job[key] = target
+
+
+def finish(queue, job, result, archive):
+    job["status"] = "실패" if result["error"] else "완료"
+    job["finished"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    job["elapsed"] = round(result["elapsed"], 2)
+    job["error"] = result["error"]
+    for key in ("rows", "matched", "unmatched_rows", "unmatched_opinion"):
+        if key in result:
+            job[key] = result[key]
+    staging = os.path.dirname(job["hospital"])
+    archive_inputs(job, archive)
+    shutil.rmtree(staging, ignore_errors=True)
+    queue.save()
+    detail = f"실패: {result['error']}" if result["error"] else f"{job['rows']}행, 매칭 {job['matched']}행"
+    print(f"[{job['status']}] {job['id']}: {os.path.basename(job['output'])} ({job['elapsed']:.2f}초, {detail})")
+
+
+def watch(inbox, outbox, archive, lg_file, config, max_jobs=1, interval=2.0, once=False):
+    """inbox를 interval초마다 확인하여 파일 쌍을 변환. once이면 inbox와 작업 목록이 빌 때까지 처리하고 종료"""
+    for directory in (outbox, archive):
+        os.makedirs(directory, exist_ok=True)
+    queue = JobQueue(outbox)
+    if queue.pending():
+        print(f"이전 실행에서 끝나지 않은 작업 {len(queue.pending())}개를 이어서 변환합니다.")
+    previous = {}
+    running = {}
+    with ProcessPoolExecutor(max_workers=max_jobs) as executor:
+        try:
+            while True:
+                pairs, waiting, previous = find_ready_pairs(inbox, previous)
+                for name, opinion_name in pairs:
+                    enqueue(queue, inbox, outbox, name, opinion_name)
+                    del previous[name], previous[opinion_name]
+
+                for job in queue.pending()[:max_jobs - len(running)]:
+                    job["status"] = "변환중"
+                    future = executor.submit(run_job, (job["hospital"], job["opinion"], job["output"]), lg_file, config)
+                    running[future] = job
+                    queue.save()
+
+                for future in [future for future in running if future.done()]:
+                    job = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # 작업 프로세스가 비정상 종료된 경우 등
+                        result = {"elapsed": 0.0, "error": f"{type(e).__name__}: {e}"}
+                    finish(queue, job, result, archive)
+
+                if once and not running and not queue.pending() and not waiting:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("종료 요청: 변환 중인 작업이 끝나기를 기다립니다. (다시 실행하면 남은 작업을 이어서 변환)")
+            for future, job in running.items():
+                try:
+                    finish(queue, job, future.result(), archive)
+                except Exception:
+                    pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="입력 폴더 감시 자동 변환")
+    parser.add_argument("inbox", help="병원결과/병원소견 파일이 들어오는 폴더")
+    parser.add_argument("--outbox", required=True, help="결과 파일과 로그/매칭 리포트를 저장할 폴더 (작업 목록도 여기에 저장)")
+    parser.add_argument("--archive", help="처리한 입력 파일을 옮길 폴더 (기본: 결과 폴더의 '입력' 폴더)")
+    parser.add_argument("--template", default="LG결과.xlsx", help="LG결과 템플릿 파일")
+    parser.add_argument("--max-jobs", type=int, default=1, help="동시에 변환할 최대 작업 수")
+    parser.add_argument("--interval", type=float, default=2.0, help="입력 폴더 확인 간격(초)")
+    parser.add_argument("--once", action="store_true", help="지금 있는 파일과 남은 작업만 처리하고 종료")
+    parser.add_argument("--stream", action="store_true", help="스트리밍 모드로 변환")
+    parser.add_argument("--mapping", help="열 매핑 설정 파일 (json/yaml/csv, 생략 시 기본 매핑)")
+    args = parser.parse_args()
+
+    if args.max_jobs < 1:
+        parser.error("--max-jobs는 1 이상이어야 합니다.")
+    if not os.path.isdir(args.inbox):
+        parser.error(f"입력 폴더가 없습니다: {args.inbox}")
+    try:
+        watch_config = ConvertConfig(stream=args.stream, **(load_mapping(args.mapping) if args.mapping else {}))
+    except ConversionError as e:
+        print(f"에러: {e}")
+        raise SystemExit(1)
+
+    print(f"감시 시작: {args.inbox} → {args.outbox} (동시 작업 {args.max_jobs}개, {args.interval}초 간격, Ctrl+C로 종료)")
+    watch(args.inbox, args.outbox, args.archive or os.path.join(args.outbox, "입력"), os.path.abspath(args.template),
+          watch_config, args.max_jobs, args.interval, args.once)